@@ -9,7 +9,7 @@ import os
 import logging
 import json
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 
 from src.analyzers.base_analyzer import BaseAnalyzer
 from src.schemas import AnalysisOperationResult
@@ -22,6 +22,48 @@ class CodebaseAnalyzer(BaseAnalyzer):
     
     Inherits from `BaseAnalyzer` to provide specific analysis implementation.
     """
+
+    # Directory listing of working_path shared by the analysis passes; see _walk()
+    _walk_cache: Optional[Tuple[Tuple[str, Tuple[str, ...], Tuple[str, ...]], ...]] = None
+
+    def _list_tree(self) -> Tuple[Tuple[str, Tuple[str, ...], Tuple[str, ...]], ...]:
+        """
+        Return the shared directory listing of working_path, listing it on first use.
+
+        Call this before starting passes concurrently so they share one listing.
+        """
+        if self._walk_cache is None:
+            self._walk_cache = tuple(
+                (root, tuple(dirs), tuple(files)) for root, dirs, files in os.walk(self.working_path)
+            )
+        return self._walk_cache
+
+    def _walk(self, skip_dirs: Iterable[str] = ()) -> Iterator[Tuple[str, List[str], Tuple[str, ...]]]:
+        """
+        Walk working_path like os.walk, reusing one listing across analysis passes.
+
+        Directories named in skip_dirs are pruned at any depth, matching the
+        ``dirs[:] = [...]`` idiom on a live walk.
+        """
+        skip = frozenset(skip_dirs)
+        pruned = set()
+        for root, dirs, files in self._list_tree():
+            if root in pruned:
+                pruned.update(os.path.join(root, d) for d in dirs)
+                continue
+            kept = []
+            for d in dirs:
+                if d in skip:
+                    pruned.add(os.path.join(root, d))
+                else:
+                    kept.append(d)
+            yield root, kept, files
+
+    async def _cleanup(self):
+        await super()._cleanup()
+        # A removed clone invalidates its listing; local trees keep theirs for later passes
+        if self.temp_dir and not os.path.exists(self.temp_dir):
+            self._walk_cache = None
     
     async def analyze(self) -> Dict[str, Any]:
         """
@@ -42,7 +84,7 @@ class CodebaseAnalyzer(BaseAnalyzer):
             
             # Collect Python file contents for analysis
             file_contents = {}
-            for root, dirs, files in os.walk(self.working_path):
+            for root, dirs, files in self._walk():
                 for file in files:
                     if file.endswith('.py'):
                         file_path = os.path.join(root, file)
@@ -171,10 +213,8 @@ class CodebaseAnalyzer(BaseAnalyzer):
         
         try:
             # Extract from Python files (Flask, FastAPI, Django)
-            for root, dirs, files in os.walk(self.working_path):
-                # Skip common non-code directories
-                dirs[:] = [d for d in dirs if d not in ['.git', '__pycache__', 'node_modules', 'venv', '.env']]
-                
+            # Skip common non-code directories
+            for root, dirs, files in self._walk(['.git', '__pycache__', 'node_modules', 'venv', '.env']):
                 for file in files:
                     if file.endswith('.py'):
                         file_path = os.path.join(root, file)
@@ -271,10 +311,8 @@ class CodebaseAnalyzer(BaseAnalyzer):
         
         try:
             # Analyze directory structure to detect architectural layers
-            for root, dirs, files in os.walk(self.working_path):
-                # Skip common non-code directories
-                dirs[:] = [d for d in dirs if d not in ['.git', '__pycache__', 'node_modules', 'venv', '.env', 'dist', 'build']]
-                
+            # Skip common non-code directories
+            for root, dirs, files in self._walk(['.git', '__pycache__', 'node_modules', 'venv', '.env', 'dist', 'build']):
                 rel_path = os.path.relpath(root, self.working_path)
                 dir_name = os.path.basename(root)
                 
@@ -532,7 +570,7 @@ class CodebaseAnalyzer(BaseAnalyzer):
         
         # Look for SQL files
         sql_files = []
-        for root, dirs, files in os.walk(self.working_path):
+        for root, dirs, files in self._walk():
             for file in files:
                 if file.endswith(('.sql', '.ddl')):
                     sql_files.append(os.path.join(root, file))
@@ -556,7 +594,7 @@ class CodebaseAnalyzer(BaseAnalyzer):
         
         # Look for Python ORM models (SQLAlchemy, Django, etc.)
         python_files = []
-        for root, dirs, files in os.walk(self.working_path):
+        for root, dirs, files in self._walk():
             for file in files:
                 if file.endswith('.py') and ('model' in file.lower() or 'schema' in file.lower()):
                     python_files.append(os.path.join(root, file))
@@ -590,11 +628,8 @@ class CodebaseAnalyzer(BaseAnalyzer):
         try:
             import ast as python_ast
             
-            # Find all Python files
-            for root, dirs, files in os.walk(self.working_path):
-                # Skip common non-code directories
-                dirs[:] = [d for d in dirs if d not in ['.git', '__pycache__', 'node_modules', 'venv', '.env']]
-                
+            # Find all Python files, skipping common non-code directories
+            for root, dirs, files in self._walk(['.git', '__pycache__', 'node_modules', 'venv', '.env']):
                 for file in files:
                     if file.endswith('.py'):
                         file_path = os.path.join(root, file)
@@ -107,9 +107,11 @@ This MCP server exposes **{tools_count} tools** for AI assistant interactions.
         
         # Example JSON
         type_examples = {'string': '"example"', 'number': '123', 'integer': '123', 'boolean': 'true'}
-        args = [f'    "{p}": {type_examples.get(props.get(p, {}).get("type", "string"), "\"value\"")}'
-                for p in required[:2]]
-        doc += f'**Example:**\n\n```json\n{{\n  "tool": "{name}",\n  "arguments": {{\n{chr(44).join(args)}\n  }}\n}}\n```\n'
+        fallback_example = '"value"'
+        example_args = ",".join(
+            f'    "{p}": {type_examples.get(props.get(p, {}).get("type", "string"), fallback_example)}'
+            for p in required[:2])
+        doc += f'**Example:**\n\n```json\n{{\n  "tool": "{name}",\n  "arguments": {{\n{example_args}\n  }}\n}}\n```\n'
         return doc
     
     def _generate_setup_section(self, project_name: str, mcp_info: Dict[str, Any], project_root: str) -> str:
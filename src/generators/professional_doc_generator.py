@@ -119,11 +119,13 @@ class ProfessionalDocumentationGenerator:
                 if mcp_info:
                     logger.info("✨ Detected MCP server - using specialized documentation generator")
                     mcp_generator = MCPDocumentationGenerator()
-                    return mcp_generator.generate(
+                    doc_content = mcp_generator.generate(
                         mcp_info=mcp_info,
                         project_name=project_name,
                         project_root=project_root
                     )
+                    self._save_document(output_path, doc_content)
+                    return doc_content
                 else:
                     logger.info("MCP server detected but no tool info available, using generic generator")
         except Exception as e:
@@ -203,7 +205,11 @@ class ProfessionalDocumentationGenerator:
         # Build final document
         doc_content = "\n\n".join(sections)
         
-        # Save the document
+        self._save_document(output_path, doc_content)
+        return doc_content
+    
+    def _save_document(self, output_path: str, doc_content: str) -> None:
+        """Save generated documentation to output_path, logging rather than raising on failure."""
         try:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             with open(output_path, 'w', encoding='utf-8') as f:
@@ -211,8 +217,6 @@ class ProfessionalDocumentationGenerator:
             logger.info(f"Professional documentation saved to: {output_path}")
         except Exception as e:
             logger.error(f"Failed to save documentation: {e}")
-        
-        return doc_content
     
     def _extract_project_name(self, repo_url: str, project_root: str) -> str:
         """Extract a clean project name."""
@@ -2474,17 +2478,13 @@ This project is licensed under the MIT License - see the [LICENSE](LICENSE) file
                     'features': ['Core functionality', 'Modular design', 'Extensible architecture']
                 }
                 
-                markdown_content = self.generate_documentation(
+                # generate_documentation saves the document to output_path on every path
+                return self.generate_documentation(
                     analysis_result=analysis_result,
                     project_root="",
                     output_path=output_path,
                     repo_url=""
                 )
-                
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(markdown_content)
-                
-                return markdown_content
             else:
                 # Default to HTML for unsupported formats
                 return self.export_documentation(
@@ -450,28 +450,28 @@ class MCPServerAnalyzer:
         configs = {}
         
         # Claude Desktop config
-        configs['claude_desktop'] = f'''{{
-  "mcpServers": {{
-    "{server_name}": {{
-      "command": "python",
-      "args": ["path/to/{Path(codebase_path).name}/server.py"],
-      "env": {{
-        "API_KEY": "your_api_key_here"
-      }}
-    }}
-  }}
-}}'''
+        configs['claude_desktop'] = json.dumps({
+            "mcpServers": {
+                server_name: {
+                    "command": "python",
+                    "args": [f"path/to/{Path(codebase_path).name}/server.py"],
+                    "env": {
+                        "API_KEY": "your_api_key_here"
+                    }
+                }
+            }
+        }, indent=2)
         
         # Cursor config
-        configs['cursor'] = f'''{{
-  "mcpServers": {{
-    "{server_name}": {{
-      "command": "python",
-      "args": ["path/to/server.py"],
-      "env": {{}}
-    }}
-  }}
-}}'''
+        configs['cursor'] = json.dumps({
+            "mcpServers": {
+                server_name: {
+                    "command": "python",
+                    "args": ["path/to/server.py"],
+                    "env": {}
+                }
+            }
+        }, indent=2)
         
         return configs
 
@@ -6,20 +6,81 @@ management and result aggregation.
 """
 
 import asyncio
+import codecs
+import gc
 import logging
+import os
 import time
-from typing import Dict, List, Any, Optional, Callable, Awaitable, Set, Tuple
+from contextvars import ContextVar
+from typing import Dict, List, Any, Optional, Callable, Awaitable, Set, Tuple, Union
 from dataclasses import dataclass, field
 from pathlib import Path
-import aiofiles
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
 
 logger = logging.getLogger(__name__)
 
+# Whether the analyze_files job running in the current context offloads sync analyzers to
+# worker processes; a context variable so overlapping jobs on one analyzer stay separate
+_offload_to_processes: ContextVar[bool] = ContextVar('offload_to_processes', default=False)
 
-@dataclass
+# Content size above which sync analyzers are offloaded to the default executor
+LARGE_CONTENT_THRESHOLD = 1024 * 1024
+
+# Number of leading bytes inspected when sniffing a non-UTF-8 file's encoding
+ENCODING_SNIFF_BYTES = 4096
+
+# Header size and magic numbers used to skip binary files without decoding them
+BINARY_SNIFF_BYTES = 4096
+BINARY_MAGIC_NUMBERS = (
+    b'\x89PNG',        # PNG
+    b'PK\x03\x04',     # ZIP / JAR / DOCX / wheel
+    b'\x7fELF',        # ELF executables
+    b'\xff\xd8\xff',   # JPEG
+    b'GIF8',           # GIF
+    b'%PDF',           # PDF
+    b'\x1f\x8b',       # gzip
+)
+
+# Byte-order marks identifying text whose NUL bytes are expected, longest first so
+# UTF-32LE is not mistaken for UTF-16LE
+TEXT_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+def _sniff_header(head: bytes) -> Tuple[bool, Optional[str]]:
+    """
+    Classify a file from its leading bytes.
+    
+    Returns ``(is_text, encoding)``, where encoding is set for BOM-marked and
+    UTF-16/32 text and None when the content decoder should detect it.
+    """
+    for bom, encoding in TEXT_BOMS:
+        if head.startswith(bom):
+            return True, encoding
+    if head.startswith(BINARY_MAGIC_NUMBERS):
+        return False, None
+    if b'\x00' not in head:
+        return True, None
+    # BOM-less UTF-16/32: NULs confined to the high-order byte lanes of each code unit
+    for width, little, big in ((4, 'utf-32-le', 'utf-32-be'), (2, 'utf-16-le', 'utf-16-be')):
+        usable = len(head) - len(head) % width
+        if not usable:
+            continue
+        lanes = [head[lane:usable:width] for lane in range(width)]
+        if b'\x00' not in lanes[0] and not any(lane.strip(b'\x00') for lane in lanes[1:]):
+            return True, little
+        if b'\x00' not in lanes[-1] and not any(lane.strip(b'\x00') for lane in lanes[:-1]):
+            return True, big
+    return False, None
+
+
+@dataclass(slots=True)
 class AnalysisResult:
     """Result of analyzing a single file or component."""
     file_path: str
@@ -37,7 +98,7 @@ class AnalysisResult:
         return self.file_size / (1024 * 1024)
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchAnalysisResult:
     """Result of analyzing a batch of files."""
     total_files: int
@@ -53,6 +114,31 @@ class BatchAnalysisResult:
         if self.total_files == 0:
             return 100.0
         return (self.successful / self.total_files) * 100
+    
+    def as_columnar(self) -> Dict[str, Any]:
+        """
+        Return per-file results as parallel NumPy columns.
+        
+        Useful for large batches where aggregations and filters such as
+        ``cols['success'] & (cols['execution_time'] > 1.0)`` should run as
+        vectorized passes instead of iterating over result objects.
+        
+        Returns:
+            Dict with ``file_path``, ``success``, ``execution_time`` and
+            ``file_size`` arrays, all of length ``len(self.results)``
+        """
+        import numpy as np
+        
+        count = len(self.results)
+        results = self.results
+        return {
+            'file_path': np.array([r.file_path for r in results], dtype=object),
+            'success': np.fromiter((r.success for r in results), dtype=bool, count=count),
+            'execution_time': np.fromiter(
+                (r.execution_time for r in results), dtype=np.float32, count=count
+            ),
+            'file_size': np.fromiter((r.file_size for r in results), dtype=np.int64, count=count),
+        }
 
 
 class ConcurrentAnalyzer:
@@ -68,16 +154,32 @@ class ConcurrentAnalyzer:
         max_concurrent_files: int = 8,
         max_file_size_mb: int = 10,
         timeout_per_file: float = 30.0,
-        memory_limit_mb: Optional[int] = None
+        memory_limit_mb: Optional[int] = None,
+        use_processes: bool = False,
+        process_pool_threshold: int = 500
     ):
+        """
+        Args:
+            max_concurrent_files: Maximum files analyzed at once
+            max_file_size_mb: Files larger than this are skipped
+            timeout_per_file: Per-file analysis timeout in seconds
+            memory_limit_mb: Optional RSS budget used to trigger GC between batches
+            use_processes: Run sync analyzers in a ProcessPoolExecutor for large
+                jobs. Each worker costs roughly 20MB resident, so this only pays
+                off for CPU-heavy analyzers over many files.
+            process_pool_threshold: Minimum number of files before the process
+                pool is used, to amortize worker startup
+        """
         self.max_concurrent_files = max_concurrent_files
         self.max_file_size_mb = max_file_size_mb
         self.timeout_per_file = timeout_per_file
         self.memory_limit_mb = memory_limit_mb
+        self.use_processes = use_processes
+        self.process_pool_threshold = process_pool_threshold
         
         # Resource management
         self.semaphore = asyncio.Semaphore(max_concurrent_files)
-        self.thread_executor = ThreadPoolExecutor(max_workers=max_concurrent_files)
+        self._process_executor: Optional[ProcessPoolExecutor] = None
         
         # Analysis handlers
         self.file_analyzers: Dict[str, Callable] = {}
@@ -85,6 +187,8 @@ class ConcurrentAnalyzer:
         
         # Progress tracking
         self.progress_callbacks: List[Callable[[str, float, Dict[str, Any]], None]] = []
+        self.progress_interval = 0.05
+        self._last_progress_ts = 0.0
         
         # Statistics
         self.stats = {
@@ -98,14 +202,14 @@ class ConcurrentAnalyzer:
     def register_file_analyzer(
         self, 
         file_extension: str, 
-        analyzer: Callable[[str, str], Awaitable[Dict[str, Any]]]
+        analyzer: Callable[[str, str], Union[Dict[str, Any], Awaitable[Dict[str, Any]]]]
     ) -> None:
         """
         Register an analyzer for specific file types.
         
         Args:
             file_extension: File extension (e.g., '.py', '.js')
-            analyzer: Async function that analyzes file content
+            analyzer: Sync or async function that analyzes file content
         """
         self.file_analyzers[file_extension.lower()] = analyzer
         logger.info(f"Registered analyzer for {file_extension} files")
@@ -113,14 +217,14 @@ class ConcurrentAnalyzer:
     def register_content_analyzer(
         self,
         content_type: str,
-        analyzer: Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+        analyzer: Callable[[str, Dict[str, Any]], Union[Dict[str, Any], Awaitable[Dict[str, Any]]]]
     ) -> None:
         """
         Register an analyzer for specific content types.
         
         Args:
             content_type: Content type identifier
-            analyzer: Async function that analyzes content
+            analyzer: Sync or async function that analyzes content
         """
         self.content_analyzers[content_type] = analyzer
         logger.info(f"Registered content analyzer for {content_type}")
@@ -170,16 +274,34 @@ class ConcurrentAnalyzer:
                 errors=["No valid files to analyze"]
             )
         
-        # Process files in batches if specified
-        if batch_size:
-            results = await self._analyze_in_batches(valid_files, batch_size, analysis_types)
-        else:
-            results = await self._analyze_concurrent(valid_files, analysis_types)
+        # Use worker processes only when the job is large enough to amortize them.
+        # Per-file tasks created below inherit this setting from the current context
+        offload_token = _offload_to_processes.set(
+            self.use_processes and len(valid_files) > self.process_pool_threshold
+        )
         
-        # Aggregate results
-        successful = len([r for r in results if r.success])
-        failed = len([r for r in results if not r.success])
-        errors = [r.error for r in results if r.error]
+        # Process files in batches if specified
+        try:
+            if batch_size:
+                results = await self._analyze_in_batches(valid_files, batch_size, analysis_types)
+            else:
+                results = await self._analyze_concurrent(valid_files, analysis_types)
+        finally:
+            _offload_to_processes.reset(offload_token)
+        
+        # Binaries are only found once their header is read; they were already counted
+        # in files_skipped and are dropped here rather than reported as failures
+        results = [r for r in results if r.analysis_type != "binary_check"]
+        
+        # Aggregate results in a single pass
+        successful = 0
+        errors = []
+        for r in results:
+            if r.success:
+                successful += 1
+            if r.error:
+                errors.append(r.error)
+        failed = len(results) - successful
         
         execution_time = time.time() - start_time
         
@@ -261,7 +383,8 @@ class ConcurrentAnalyzer:
                         'total': total,
                         'current_file': result.file_path,
                         'success': result.success
-                    }
+                    },
+                    force=completed == total
                 )
                 
             except Exception as e:
@@ -309,15 +432,31 @@ class ConcurrentAnalyzer:
                     'total_batches': total_batches,
                     'files_completed': len(all_results),
                     'total_files': total_files
-                }
+                },
+                force=True
             )
             
             # Optional memory cleanup between batches
             if batch_num < total_batches:
-                await asyncio.sleep(0.1)  # Brief pause
+                self._collect_if_over_memory_limit()
         
         return all_results
     
+    def _collect_if_over_memory_limit(self) -> None:
+        """Run a GC pass when resident memory nears ``memory_limit_mb``."""
+        if not self.memory_limit_mb:
+            return
+        
+        try:
+            import psutil
+        except ImportError:
+            return
+        
+        rss = psutil.Process().memory_info().rss
+        if rss > self.memory_limit_mb * 1024 * 1024 * 0.8:
+            logger.debug(f"RSS {rss / 1024 / 1024:.1f}MB near limit, collecting garbage")
+            gc.collect()
+    
     async def _analyze_file_internal(
         self,
         file_path: str,
@@ -353,6 +492,15 @@ class ConcurrentAnalyzer:
                     error=f"Failed to read file: {str(e)}",
                     file_size=file_size
                 )
+            if content is None:
+                self.stats['files_skipped'] += 1
+                return AnalysisResult(
+                    file_path=file_path,
+                    analysis_type="binary_check",
+                    success=False,
+                    error="Binary file skipped",
+                    file_size=file_size
+                )
             
             # Perform analysis
             analysis_result = await asyncio.wait_for(
@@ -391,27 +539,48 @@ class ConcurrentAnalyzer:
                 execution_time=execution_time
             )
     
-    async def _read_file_safe(self, file_path: str) -> str:
-        """Safely read file content with encoding detection."""
-        encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+    async def _read_file_safe(self, file_path: str) -> Optional[str]:
+        """
+        Read and decode a file with a single open.
         
-        for encoding in encodings:
-            try:
-                async with aiofiles.open(file_path, 'r', encoding=encoding) as f:
-                    return await f.read()
-            except UnicodeDecodeError:
-                continue
-            except Exception as e:
-                logger.warning(f"Failed to read {file_path} with {encoding}: {e}")
-                continue
+        The header is sniffed first, so binaries are rejected (returning None)
+        after reading only BINARY_SNIFF_BYTES; text files reuse that header.
+        """
+        import aiofiles
         
-        # Last resort: read as binary and decode with errors='ignore'
         try:
             async with aiofiles.open(file_path, 'rb') as f:
-                content_bytes = await f.read()
-                return content_bytes.decode('utf-8', errors='ignore')
+                head = await f.read(BINARY_SNIFF_BYTES)
+                is_text, encoding = _sniff_header(head)
+                if not is_text:
+                    return None
+                content_bytes = head + await f.read()
         except Exception as e:
-            raise Exception(f"Unable to read file with any encoding: {e}")
+            raise Exception(f"Unable to read file: {e}")
+        
+        return self._decode_content(content_bytes, encoding)
+    
+    def _decode_content(self, content_bytes: bytes, encoding: Optional[str] = None) -> str:
+        """Decode file bytes once, detecting the encoding from a prefix if not given and not UTF-8."""
+        if encoding is not None:
+            return content_bytes.decode(encoding, errors='replace')
+        
+        try:
+            return content_bytes.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+        
+        encoding = None
+        try:
+            import charset_normalizer
+            encoding = charset_normalizer.detect(content_bytes[:ENCODING_SNIFF_BYTES])['encoding']
+        except ImportError:
+            pass
+        
+        try:
+            return content_bytes.decode(encoding or 'latin-1', errors='replace')
+        except LookupError:
+            return content_bytes.decode('latin-1', errors='replace')
     
     async def _perform_analysis(
         self,
@@ -429,7 +598,7 @@ class ConcurrentAnalyzer:
         if file_ext in self.file_analyzers:
             analyzer = self.file_analyzers[file_ext]
             try:
-                file_analysis = await analyzer(file_path, content)
+                file_analysis = await self._call_analyzer(analyzer, file_path, content)
                 results['file_analysis'] = file_analysis
             except Exception as e:
                 logger.error(f"File analyzer failed for {file_path}: {e}")
@@ -441,7 +610,9 @@ class ConcurrentAnalyzer:
                 if analysis_type in self.content_analyzers:
                     analyzer = self.content_analyzers[analysis_type]
                     try:
-                        content_analysis = await analyzer(content, {'file_path': file_path})
+                        content_analysis = await self._call_analyzer(
+                            analyzer, content, {'file_path': file_path}
+                        )
                         results[analysis_type] = content_analysis
                     except Exception as e:
                         logger.error(f"Content analyzer {analysis_type} failed for {file_path}: {e}")
@@ -449,11 +620,35 @@ class ConcurrentAnalyzer:
         
         # Basic analysis if no specific analyzers
         if not results:
-            results = await self._basic_analysis(file_path, content)
+            results = self._basic_analysis(file_path, content)
         
         return results
     
-    async def _basic_analysis(self, file_path: str, content: str) -> Dict[str, Any]:
+    async def _call_analyzer(self, analyzer: Callable, *args: Any) -> Dict[str, Any]:
+        """
+        Invoke an analyzer that may be either sync or async.
+        
+        Sync analyzers run inline; for large inputs they are moved to the
+        loop's default executor so regex work doesn't stall the event loop.
+        When process offload is active for the current job, sync analyzers
+        (which must be picklable module-level functions) run in worker processes.
+        """
+        if asyncio.iscoroutinefunction(analyzer):
+            return await analyzer(*args)
+        
+        if _offload_to_processes.get():
+            if self._process_executor is None:
+                self._process_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._process_executor, analyzer, *args)
+        
+        if any(isinstance(arg, str) and len(arg) > LARGE_CONTENT_THRESHOLD for arg in args):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, analyzer, *args)
+        
+        return analyzer(*args)
+    
+    def _basic_analysis(self, file_path: str, content: str) -> Dict[str, Any]:
         """Perform basic analysis on any file."""
         lines = content.split('\n')
         
@@ -486,9 +681,24 @@ class ConcurrentAnalyzer:
         self, 
         message: str, 
         progress: float, 
-        details: Dict[str, Any]
+        details: Dict[str, Any],
+        force: bool = False
     ) -> None:
-        """Notify all progress callbacks."""
+        """
+        Notify all progress callbacks.
+        
+        Per-file updates are coalesced so callbacks fire at most once per
+        ``progress_interval`` seconds; ``force`` bypasses the throttle for
+        milestones such as batch completion or the final file.
+        """
+        if not self.progress_callbacks:
+            return
+        
+        now = time.monotonic()
+        if not force and now - self._last_progress_ts < self.progress_interval:
+            return
+        self._last_progress_ts = now
+        
         for callback in self.progress_callbacks:
             try:
                 callback(message, progress, details)
@@ -499,8 +709,10 @@ class ConcurrentAnalyzer:
         """Shutdown the analyzer and cleanup resources."""
         logger.info("Shutting down concurrent analyzer")
         
-        # Shutdown thread executor
-        self.thread_executor.shutdown(wait=True)
+        # Shutdown worker processes if they were started
+        if self._process_executor is not None:
+            self._process_executor.shutdown(wait=True)
+            self._process_executor = None
         
         # Clear callbacks
         self.progress_callbacks.clear()
@@ -521,7 +733,7 @@ class ConcurrentAnalyzer:
 
 # Convenience functions for common analysis tasks
 
-async def analyze_python_file(file_path: str, content: str) -> Dict[str, Any]:
+def analyze_python_file(file_path: str, content: str) -> Dict[str, Any]:
     """Analyze Python file structure."""
     import re
     
@@ -539,7 +751,7 @@ async def analyze_python_file(file_path: str, content: str) -> Dict[str, Any]:
     }
 
 
-async def analyze_javascript_file(file_path: str, content: str) -> Dict[str, Any]:
+def analyze_javascript_file(file_path: str, content: str) -> Dict[str, Any]:
     """Analyze JavaScript file structure."""
     import re
     
@@ -4,10 +4,16 @@ Types and schemas for Document Automation MCP Server
 Following the design patterns from the original TypeScript MCP server.
 """
 
+import json
 from pydantic import BaseModel, Field
 from typing import Dict, List, Optional, Any, Union
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # User context passed through OAuth (similar to original Props)
 class UserProps(BaseModel):
     login: str
@@ -73,12 +79,30 @@ class McpTextContent(BaseModel):
 class McpResponse(BaseModel):
     content: List[McpTextContent]
 
+# Fallback for values neither encoder handles natively: sets become lists, the rest strings
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+# JSON encoding for response payloads: orjson when available, stdlib otherwise
+def _dumps_json(data: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+                default=_json_default
+            ).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, default=_json_default)
+
 # Standard response creators
 def create_success_response(message: str, data: Any = None) -> McpResponse:
     text = f"**Success**\n\n{message}"
     if data is not None:
-        import json
-        text += f"\n\n**Result:**\n```json\n{json.dumps(data, indent=2, default=str)}\n```"
+        text += f"\n\n**Result:**\n```json\n{_dumps_json(data)}\n```"
     return McpResponse(
         content=[McpTextContent(text=text)]
     )
@@ -86,8 +110,7 @@ def create_success_response(message: str, data: Any = None) -> McpResponse:
 def create_error_response(message: str, details: Any = None) -> McpResponse:
     text = f"**Error**\n\n{message}"
     if details is not None:
-        import json
-        text += f"\n\n**Details:**\n```json\n{json.dumps(details, indent=2, default=str)}\n```"
+        text += f"\n\n**Details:**\n```json\n{_dumps_json(details)}\n```"
     return McpResponse(
         content=[McpTextContent(text=text, is_error=True)]
     )
@@ -134,6 +157,43 @@ class DirectoryInfo(BaseModel):
     files: List[FileInfo]
     subdirectories: List['DirectoryInfo']
 
+# Flat, non-recursive project structure: one row per file/directory, linked by parent_id
+class FlatNode(BaseModel):
+    id: int
+    parent_id: Optional[int] = None
+    name: str
+    path: str
+    kind: str  # "directory" or "file"
+    size: int = 0
+    type: Optional[str] = None
+
+class FlatDirectoryTree(BaseModel):
+    nodes: List[FlatNode]
+
+    @classmethod
+    def from_directory_info(cls, root: DirectoryInfo) -> 'FlatDirectoryTree':
+        """Flatten a DirectoryInfo tree iteratively (no recursion depth limit)."""
+        nodes: List[FlatNode] = []
+        stack = [(root, None)]
+        while stack:
+            directory, parent_id = stack.pop()
+            dir_id = len(nodes)
+            nodes.append(FlatNode(
+                id=dir_id, parent_id=parent_id, name=directory.name,
+                path=directory.path, kind="directory"
+            ))
+            for file_info in directory.files:
+                nodes.append(FlatNode(
+                    id=len(nodes), parent_id=dir_id, name=file_info.name,
+                    path=file_info.path, kind="file", size=file_info.size,
+                    type=file_info.type
+                ))
+            stack.extend((sub, dir_id) for sub in reversed(directory.subdirectories))
+        return cls(nodes=nodes)
+
+    def children(self, node_id: int) -> List[FlatNode]:
+        return [node for node in self.nodes if node.parent_id == node_id]
+
 # Code analysis results
 class CodeAnalysisResult(BaseModel):
     project_structure: DirectoryInfo
@@ -1,30 +1,58 @@
 """Content filter for blocking sensitive data in documentation."""
 
+import os
 import re
+import mmap
+import codecs
+import functools
 import logging
-from typing import List, Dict, Any, Optional, Set
-from pathlib import Path
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Set, Tuple, Union, BinaryIO, TextIO
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 logger = logging.getLogger(__name__)
 
+# File extensions whose files may be referenced in generated documentation
+_ALLOWED_DOC_EXTENSIONS = frozenset({
+    '.md', '.rst', '.txt', '.json', '.yaml', '.yml', '.toml', '.py', '.js', '.ts'
+})
+
+
+def _basename(path: str) -> str:
+    """Return the last component of a slash- or backslash-separated path without building a Path."""
+    return path.rstrip('/\\').rsplit('/', 1)[-1].rsplit('\\', 1)[-1]
+
+
+def _scope_inline_flags(pattern: str) -> str:
+    """Wrap a pattern for use inside an alternation, scoping any leading global flags."""
+    match = re.match(r'\(\?([aiLmsux]+)\)', pattern)
+    if match:
+        return f'(?{match.group(1)}:{pattern[match.end():]})'
+    return f'(?:{pattern})'
+
 
 class ContentFilter:
     """Filters sensitive content from documentation output."""
     
-    SENSITIVE_FILE_PATTERNS = {
+    SENSITIVE_FILE_PATTERNS = frozenset({
         '.env', '.env.local', '.env.development', '.env.production', '.env.test', '.env.staging',
         '*.pem', '*.key', '*.crt', '*.cer', '*.p12', '*.pfx', '*.jks', '*.keystore',
         '*secret*', '*credential*', '*password*', '*token*', 'credentials.json',
         'aws_credentials', '.aws/credentials', '.gcp/credentials.json',
         'id_rsa', 'id_dsa', 'id_ecdsa', 'id_ed25519', '*.ppk',
         '*.sqlite', '*.sqlite3', '*.db', '.htpasswd', '.htaccess'
-    }
+    })
     
-    EXCLUDED_FOLDERS = {
+    EXCLUDED_FOLDERS = frozenset({
         '__pycache__', 'node_modules', '.git', '.svn', '.hg', 'venv', '.venv', 'env',
         '.idea', '.vscode', '.vs', 'dist', 'build', 'target', 'out',
         '.pytest_cache', '.mypy_cache', '.tox', 'htmlcov', 'coverage', '.eggs'
-    }
+    })
     
     SENSITIVE_CONTENT_PATTERNS = [
         r'(?i)(api[_-]?key|secret[_-]?key|access[_-]?token|auth[_-]?token)\s*[=:]\s*["\']?[\w\-]{16,}["\']?',
@@ -33,114 +61,345 @@ class ContentFilter:
         r'(?i)(postgres|mysql|mongodb)(\+srv)?://[^\s"\']+',
         r'(?i)(password|passwd|pwd)\s*[=:]\s*["\']?[^\s"\']{4,}["\']?',
         r'-----BEGIN (RSA |EC |DSA |OPENSSH )?PRIVATE KEY-----',
-        r'eyJ[a-zA-Z0-9_-]*\.eyJ[a-zA-Z0-9_-]*\.[a-zA-Z0-9_-]*',
+        r'eyJ[A-Za-z0-9_-]{10,}\.eyJ[A-Za-z0-9_-]{10,}\.[A-Za-z0-9_-]{10,}',
         r'(?i)(client[_-]?secret|private[_-]?key)\s*[=:]\s*["\']?[\w\-]{16,}["\']?'
     ]
     
-    FILE_DESCRIPTIONS = {
+    # Lowercase substrings at least one of which appears in any match of the
+    # built-in patterns; content without any of them cannot be sensitive.
+    SENSITIVE_LITERALS = (
+        'api', 'secret', 'token', 'akia', 'url', 'postgres', 'mysql', 'mongodb',
+        'pass', 'pwd', 'private', 'eyj'
+    )
+    
+    # Per-pattern literals, in SENSITIVE_CONTENT_PATTERNS order
+    PATTERN_LITERALS = (
+        ('api', 'secret', 'token'),
+        ('akia',),
+        ('url',),
+        ('postgres', 'mysql', 'mongodb'),
+        ('pass', 'pwd'),
+        ('private',),
+        ('eyj',),
+        ('secret', 'private'),
+    )
+    
+    # Minimum number of top-level subdirectories before filtering fans out to threads
+    PARALLEL_FILTER_THRESHOLD = 16
+    
+    FILE_DESCRIPTIONS = MappingProxyType({
         '.py': 'Python source', '.js': 'JavaScript source', '.ts': 'TypeScript source',
         '.jsx': 'React component', '.tsx': 'React TS component', '.json': 'JSON config',
         '.yaml': 'YAML config', '.yml': 'YAML config', '.md': 'Markdown doc',
         '.html': 'HTML template', '.css': 'CSS stylesheet', '.sql': 'SQL script',
         '.sh': 'Shell script', '.toml': 'TOML config', '.xml': 'XML file'
-    }
+    })
     
     def __init__(self, custom_patterns: Optional[List[str]] = None,
                  custom_folders: Optional[Set[str]] = None,
-                 custom_files: Optional[Set[str]] = None):
+                 custom_files: Optional[Set[str]] = None,
+                 custom_literals: Optional[Set[str]] = None):
+        """
+        Args:
+            custom_patterns: Extra sensitive-content regexes
+            custom_folders: Extra folder names to exclude
+            custom_files: Extra file names or ``*`` wildcards to treat as sensitive
+            custom_literals: Lowercase substrings that every match of
+                ``custom_patterns`` contains. Without them the literal
+                prefilter is disabled whenever custom patterns are given.
+        """
         self.sensitive_patterns = self.SENSITIVE_CONTENT_PATTERNS + (custom_patterns or [])
         self.excluded_folders = self.EXCLUDED_FOLDERS | (custom_folders or set())
         self.sensitive_files = self.SENSITIVE_FILE_PATTERNS | (custom_files or set())
         
         # Pre-compute lowercase sets for O(1) lookups
-        self._exact_files = {p.lower() for p in self.sensitive_files if not p.startswith('*')}
+        self._exact_files = frozenset(p.lower() for p in self.sensitive_files if not p.startswith('*'))
         self._wildcard_patterns = [p[1:].lower() for p in self.sensitive_files if p.startswith('*')]
-        self._folder_set = {f.lower() for f in self.excluded_folders}
+        # All wildcard fragments in one alternation: a single scan per file name
+        self._wildcard_regex = (
+            re.compile('|'.join(re.escape(w) for w in sorted(self._wildcard_patterns)))
+            if self._wildcard_patterns else None
+        )
+        self._folder_set = frozenset(f.lower() for f in self.excluded_folders)
+        self._folder_wildcard_suffixes = tuple(
+            f[1:].lower() for f in self.excluded_folders if f.startswith('*')
+        )
+        # Memoized decisions; the same names recur across sibling directories
+        self._is_sensitive_filename = functools.lru_cache(maxsize=8192)(
+            self._is_sensitive_filename_impl
+        )
+        self._is_sensitive_file_cached = functools.lru_cache(maxsize=16384)(
+            self._is_sensitive_file_impl
+        )
+        self._is_excluded_folder_cached = functools.lru_cache(maxsize=16384)(
+            self._is_excluded_folder_impl
+        )
         self._compiled_patterns = [re.compile(p) for p in self.sensitive_patterns]
+        self._combined_pattern = re.compile(
+            '|'.join(_scope_inline_flags(p) for p in self.sensitive_patterns)
+        )
+        # Same union for raw bytes; the built-in patterns are ASCII-only
+        self._combined_pattern_bytes = re.compile(self._combined_pattern.pattern.encode())
+        self._hyperscan_db = self._build_hyperscan_db()
+        
+        if custom_patterns and not custom_literals:
+            self._literal_prefilter = None
+        else:
+            self._literal_prefilter = self.SENSITIVE_LITERALS + tuple(
+                literal.lower() for literal in (custom_literals or ())
+            )
+        self._guarded_patterns = self._build_guarded_patterns(custom_literals)
     
-    def is_sensitive_file(self, filepath: str) -> bool:
-        """Check if file should be excluded due to sensitivity."""
-        path = Path(filepath)
-        filename = path.name.lower()
+    def _build_guarded_patterns(
+        self, custom_literals: Optional[Set[str]]
+    ) -> Tuple[Tuple[Optional[Tuple[str, ...]], re.Pattern], ...]:
+        """
+        Pair each compiled pattern with the literals its matches must contain.
         
+        Built once per filter so ``contains_sensitive_content`` only runs the
+        regexes whose literals occur in the input. Custom patterns are guarded
+        by ``custom_literals`` when given and otherwise always run.
+        """
+        custom_guard = tuple(literal.lower() for literal in custom_literals) if custom_literals else None
+        builtin_count = len(self.PATTERN_LITERALS)
+        return tuple(
+            (self.PATTERN_LITERALS[i] if i < builtin_count else custom_guard, pattern)
+            for i, pattern in enumerate(self._compiled_patterns)
+        )
+    
+    @classmethod
+    def default(cls) -> 'ContentFilter':
+        """Return the shared filter with the default (non-strict) configuration."""
+        return create_content_filter()
+    
+    def _build_hyperscan_db(self) -> Optional[Any]:
+        """Compile patterns into a Hyperscan database when the library is installed."""
+        if hyperscan is None:
+            return None
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[p.encode() for p in self.sensitive_patterns],
+                ids=list(range(len(self.sensitive_patterns))),
+                elements=len(self.sensitive_patterns),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(self.sensitive_patterns)
+            )
+            return db
+        except Exception as e:
+            logger.debug(f"Hyperscan unavailable for content patterns, using re: {e}")
+            return None
+    
+    def _is_sensitive_filename_impl(self, filename: str) -> bool:
+        """Check a lowercase bare file name against exact and wildcard patterns."""
         # O(1) exact match check
         if filename in self._exact_files:
             return True
         
-        # Wildcard pattern check using string methods
-        if any(filename.endswith(w) or w in filename for w in self._wildcard_patterns):
+        # Wildcard fragments match anywhere in the name (suffixes included)
+        return self._wildcard_regex is not None and self._wildcard_regex.search(filename) is not None
+    
+    def is_sensitive_file(self, filepath: str) -> bool:
+        """Check if file should be excluded due to sensitivity."""
+        return self._is_sensitive_file_cached(filepath)
+    
+    def _is_sensitive_file_impl(self, filepath: str) -> bool:
+        # Normalize once; both checks below work on the same lowered path
+        parts = filepath.lower().replace('\\', '/').rstrip('/').split('/')
+        if self._is_sensitive_filename(parts[-1]):
             return True
         
-        # Check if in excluded folder - O(1) per part
-        return any(part.lower() in self._folder_set for part in path.parts)
+        # Check if in excluded folder with one C-level set check over all parts
+        return not self._folder_set.isdisjoint(parts)
     
     def is_excluded_folder(self, folder_path: str) -> bool:
         """Check if folder should be excluded from documentation."""
-        folder_name = Path(folder_path).name.lower()
+        return self._is_excluded_folder_cached(folder_path)
+    
+    def _is_excluded_folder_impl(self, folder_path: str) -> bool:
+        return self._is_excluded_folder_lc(_basename(folder_path).lower())
+    
+    def _is_excluded_folder_lc(self, folder_name: str) -> bool:
+        """Check an already-lowercased bare folder name."""
         if folder_name in self._folder_set:
             return True
-        return any(folder_name.endswith(p[1:].lower()) for p in self.excluded_folders if p.startswith('*'))
+        return bool(self._folder_wildcard_suffixes) and folder_name.endswith(self._folder_wildcard_suffixes)
     
     def contains_sensitive_content(self, content: str) -> bool:
         """Check if content contains sensitive data."""
-        return any(p.search(content) for p in self._compiled_patterns)
+        lowered = None
+        if self._literal_prefilter is not None:
+            lowered = content.lower()
+            if not any(literal in lowered for literal in self._literal_prefilter):
+                return False
+        
+        if self._hyperscan_db is not None:
+            hits = []
+            self._hyperscan_db.scan(
+                content.encode('utf-8', errors='ignore'),
+                match_event_handler=lambda *match: hits.append(match)
+            )
+            return bool(hits)
+        
+        if lowered is None:
+            return self._combined_pattern.search(content) is not None
+        
+        # Only run the patterns whose required literals are present
+        for literals, pattern in self._guarded_patterns:
+            if literals is not None and not any(literal in lowered for literal in literals):
+                continue
+            if pattern.search(content):
+                return True
+        return False
+    
+    def contains_sensitive_content_bytes(self, buf: Union[bytes, bytearray, memoryview, mmap.mmap]) -> bool:
+        """Check raw (UTF-8 or ASCII) bytes for sensitive data without decoding them."""
+        return self._combined_pattern_bytes.search(buf) is not None
+    
+    def sanitize_content_bytes(self, buf: bytes, replacement: bytes = b"[REDACTED]") -> bytes:
+        """Bytes counterpart of ``sanitize_content``."""
+        return self._combined_pattern_bytes.sub(replacement, buf)
+    
+    def scan_file(self, file_path: str) -> bool:
+        """Check a file for sensitive data by memory-mapping it and scanning the bytes."""
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return self.contains_sensitive_content_bytes(mapped)
+    
+    def scan_stream(self, stream: Union[BinaryIO, TextIO], chunk_size: int = 65536,
+                    overlap: int = 256) -> bool:
+        """
+        Check a file object for sensitive content without loading it whole.
+        
+        Reads ``chunk_size`` pieces and carries the last ``overlap`` characters
+        forward so matches spanning a chunk boundary are still found. Stops at
+        the first hit.
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        tail = ''
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                text = decoder.decode(b'', final=True)
+            else:
+                text = decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            
+            window = tail + text
+            if self._combined_pattern.search(window):
+                return True
+            if not chunk:
+                return False
+            tail = window[-overlap:]
     
     def sanitize_content(self, content: str, replacement: str = "[REDACTED]") -> str:
         """Remove or mask sensitive content from text."""
-        result = content
-        for pattern in self._compiled_patterns:
-            result = pattern.sub(replacement, result)
-        return result
+        return self._combined_pattern.sub(replacement, content)
     
     def filter_project_structure(self, structure: Dict[str, Any]) -> Dict[str, Any]:
-        """Filter sensitive files and folders from project structure."""
+        """
+        Filter sensitive files and folders from project structure.
+        
+        When the top level lists at least ``PARALLEL_FILTER_THRESHOLD``
+        subdirectories, those subtrees are filtered concurrently on a thread
+        pool; deeper levels are always filtered inline.
+        """
         if not structure:
             return structure
-        
-        filtered = {}
-        for key, value in structure.items():
-            if key == 'files' and isinstance(value, list):
-                filtered['files'] = [f for f in value if not self.is_sensitive_file(
-                    f.get('path', f) if isinstance(f, dict) else f)]
-            elif key in ('directories', 'children'):
-                if isinstance(value, list):
-                    filtered[key] = [
-                        self.filter_project_structure(d) if isinstance(d, dict) else d
-                        for d in value
-                        if not self.is_excluded_folder(d.get('name', d.get('path', '')) if isinstance(d, dict) else d)
-                    ]
+        return self._filter_tree(structure, parallel=True)
+    
+    def _filter_tree(self, structure: Dict[str, Any], parallel: bool = False) -> Dict[str, Any]:
+        """Filter one subtree using an iterative worklist."""
+        # Iterative worklist of (source node, filtered copy being built)
+        root: Dict[str, Any] = {}
+        stack = [(structure, root)]
+        # Top-level subtrees handed to the thread pool: (target list, index, source)
+        deferred = []
+        while stack:
+            source, filtered = stack.pop()
+            for key, value in source.items():
+                if key == 'files' and isinstance(value, list):
+                    filtered['files'] = [f for f in value if not self.is_sensitive_file(
+                        f.get('path', f) if isinstance(f, dict) else f)]
+                elif key in ('directories', 'children'):
+                    if isinstance(value, list):
+                        kept = []
+                        fan_out = (
+                            parallel and source is structure
+                            and len(value) >= self.PARALLEL_FILTER_THRESHOLD
+                        )
+                        for d in value:
+                            if isinstance(d, dict):
+                                if self.is_excluded_folder(d.get('name', d.get('path', ''))):
+                                    continue
+                                if fan_out:
+                                    deferred.append((kept, len(kept), d))
+                                    kept.append(None)
+                                    continue
+                                child: Dict[str, Any] = {}
+                                stack.append((d, child))
+                                kept.append(child)
+                            elif not self.is_excluded_folder(d):
+                                kept.append(d)
+                        filtered[key] = kept
+                    elif isinstance(value, dict):
+                        kept_map = {}
+                        for k, v in value.items():
+                            if self.is_excluded_folder(k):
+                                continue
+                            if isinstance(v, dict):
+                                child = {}
+                                stack.append((v, child))
+                                kept_map[k] = child
+                            else:
+                                kept_map[k] = v
+                        filtered[key] = kept_map
+                    else:
+                        filtered[key] = value
                 elif isinstance(value, dict):
-                    filtered[key] = {
-                        k: self.filter_project_structure(v) if isinstance(v, dict) else v
-                        for k, v in value.items() if not self.is_excluded_folder(k)
-                    }
+                    child = {}
+                    stack.append((value, child))
+                    filtered[key] = child
                 else:
                     filtered[key] = value
-            elif isinstance(value, dict):
-                filtered[key] = self.filter_project_structure(value)
-            else:
-                filtered[key] = value
-        return filtered
+        
+        if deferred:
+            workers = min(len(deferred), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                subtrees = executor.map(self._filter_tree, [d for _, _, d in deferred])
+                for (kept, index, _), subtree in zip(deferred, subtrees):
+                    kept[index] = subtree
+        return root
     
     def get_safe_file_description(self, filepath: str) -> str:
         """Get safe description of file without leaking content."""
-        ext = Path(filepath).suffix.lower()
-        return self.FILE_DESCRIPTIONS.get(ext, f'{ext[1:].upper()} file' if ext else 'File')
+        return _describe_extension(os.path.splitext(filepath)[1].lower())
     
     def should_include_in_docs(self, filepath: str) -> bool:
         """Determine if file should be included in documentation."""
         if self.is_sensitive_file(filepath):
             return False
-        ext = Path(filepath).suffix.lower()
-        allowed = {'.md', '.rst', '.txt', '.json', '.yaml', '.yml', '.toml', '.py', '.js', '.ts'}
-        return ext in allowed or True
+        return os.path.splitext(filepath)[1].lower() in _ALLOWED_DOC_EXTENSIONS
+
 
+@functools.lru_cache(maxsize=4096)
+def _describe_extension(ext: str) -> str:
+    """Map a lowercase extension to its generic description."""
+    return ContentFilter.FILE_DESCRIPTIONS.get(ext, f'{ext[1:].upper()} file' if ext else 'File')
 
+
+@functools.lru_cache(maxsize=None)
 def create_content_filter(strict_mode: bool = False) -> ContentFilter:
-    """Factory function to create ContentFilter with preset configurations."""
+    """
+    Factory function to create ContentFilter with preset configurations.
+    
+    Presets are built once and shared, so callers must treat the returned
+    filter as read-only.
+    """
     if strict_mode:
         return ContentFilter(
             custom_patterns=[r'(?i)(token|key|secret|password)[\w\-]*\s*[=:]\s*["\']?[\w\-]{8,}["\']?'],
-            custom_folders={'logs', 'tmp', 'temp', 'cache'}
+            custom_folders={'logs', 'tmp', 'temp', 'cache'},
+            custom_literals={'token', 'key', 'secret', 'password'}
         )
     return ContentFilter()
@@ -1,18 +1,17 @@
 import re
 import os
 import logging
-from typing import Set, List, Optional
-from urllib.parse import urlparse
+from typing import FrozenSet, List, Optional, Tuple
 from src.schemas import SecurityValidationResult, UserProps
 
 logger = logging.getLogger(__name__)
 
 # Allowed GitHub usernames for write operations (similar to original)
-ALLOWED_USERNAMES: Set[str] = {
+ALLOWED_USERNAMES: FrozenSet[str] = frozenset({
     # Add GitHub usernames of users who should have access to write operations
     # For example: 'yourusername', 'coworkerusername'
     'coleam00'  # Replace with actual usernames
-}
+})
 
 # Dangerous path patterns to block
 DANGEROUS_PATHS = [
@@ -25,14 +24,34 @@ DANGEROUS_PATHS = [
     r'~/',  # Home directory shortcuts
 ]
 
+# All dangerous patterns in one case-insensitive alternation; group N is DANGEROUS_PATHS[N-1]
+_DANGEROUS_PATHS_RE = re.compile('|'.join(f'({p})' for p in DANGEROUS_PATHS), re.IGNORECASE)
+
+# Lowercase system directory prefixes that absolute paths may not start with
+_SYSTEM_DIR_PREFIXES = ('/etc', '/usr/bin', '/root', 'c:\\windows')
+
+# Hosts accepted by validate_github_url
+_GITHUB_HOSTS = frozenset({'github.com', 'www.github.com'})
+
 # Allowed file extensions for analysis
-ALLOWED_EXTENSIONS = {
+ALLOWED_EXTENSIONS = frozenset({
     '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.cpp', '.c', '.h', '.hpp',
     '.cs', '.go', '.rs', '.rb', '.php', '.swift', '.kt', '.scala', '.r',
     '.json', '.yaml', '.yml', '.xml', '.toml', '.ini', '.cfg', '.conf',
     '.md', '.txt', '.rst', '.html', '.css', '.scss', '.sass', '.less',
     '.sql', '.dockerfile', '.makefile', '.sh', '.bat', '.ps1'
-}
+})
+
+# Credentials (key=value) and API keys/tokens (long base64-like runs) to redact from errors
+_SANITIZE_RE = re.compile(
+    r'(?P<kv>(?P<key>password|token|secret)[=:]\s*\S+)|(?P<blob>[A-Za-z0-9+/]{20,})',
+    re.IGNORECASE
+)
+
+def _redact_match(match: re.Match) -> str:
+    if match.lastgroup == 'kv':
+        return f"{match.group('key').lower()}=[REDACTED]"
+    return '[REDACTED]'
 
 # Maximum file size for analysis (in bytes)
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
@@ -54,18 +73,19 @@ def validate_path(path: str) -> SecurityValidationResult:
         )
     
     # Check for dangerous path patterns
-    for pattern in DANGEROUS_PATHS:
-        if re.search(pattern, path, re.IGNORECASE):
-            return SecurityValidationResult(
-                is_valid=False,
-                error=f"Path contains potentially dangerous pattern: {pattern}"
-            )
+    match = _DANGEROUS_PATHS_RE.search(path)
+    if match:
+        pattern = DANGEROUS_PATHS[match.lastindex - 1]
+        return SecurityValidationResult(
+            is_valid=False,
+            error=f"Path contains potentially dangerous pattern: {pattern}"
+        )
     
     # Validate absolute paths
     if os.path.isabs(path):
         # Check if it's trying to access system directories
-        normalized_path = os.path.normpath(path)
-        if any(normalized_path.startswith(danger) for danger in ['/etc', '/usr/bin', '/root', 'C:\\Windows']):
+        normalized_path = os.path.normpath(path).lower()
+        if normalized_path.startswith(_SYSTEM_DIR_PREFIXES):
             return SecurityValidationResult(
                 is_valid=False,
                 error="Access to system directories is not allowed"
@@ -89,45 +109,58 @@ def validate_github_url(url: str) -> SecurityValidationResult:
             error="GitHub URL cannot be empty"
         )
     
-    try:
-        parsed = urlparse(url)
-        
-        # Must be GitHub
-        if parsed.netloc.lower() not in ['github.com', 'www.github.com']:
-            return SecurityValidationResult(
-                is_valid=False,
-                error="Only GitHub URLs are allowed"
-            )
-        
-        # Must be HTTPS
-        if parsed.scheme != 'https':
-            return SecurityValidationResult(
-                is_valid=False,
-                error="Only HTTPS URLs are allowed"
-            )
-        
-        # Basic path validation
-        if not parsed.path or parsed.path == '/':
-            return SecurityValidationResult(
-                is_valid=False,
-                error="GitHub URL must point to a specific repository"
-            )
-        
-        # Check for valid repository path format
-        path_parts = parsed.path.strip('/').split('/')
-        if len(path_parts) < 2:
-            return SecurityValidationResult(
-                is_valid=False,
-                error="GitHub URL must be in format: https://github.com/owner/repo"
-            )
-        
-        return SecurityValidationResult(is_valid=True)
+    scheme, host, path = _split_url(url)
     
-    except Exception as e:
+    # Must be GitHub
+    if host.lower() not in _GITHUB_HOSTS:
+        return SecurityValidationResult(
+            is_valid=False,
+            error="Only GitHub URLs are allowed"
+        )
+    
+    # Must be HTTPS
+    if scheme.lower() != 'https':
+        return SecurityValidationResult(
+            is_valid=False,
+            error="Only HTTPS URLs are allowed"
+        )
+    
+    # Basic path validation
+    if not path or path == '/':
+        return SecurityValidationResult(
+            is_valid=False,
+            error="GitHub URL must point to a specific repository"
+        )
+    
+    # Check for valid repository path format
+    path_parts = path.strip('/').split('/')
+    if len(path_parts) < 2:
         return SecurityValidationResult(
             is_valid=False,
-            error=f"Invalid URL format: {str(e)}"
+            error="GitHub URL must be in format: https://github.com/owner/repo"
         )
+    
+    return SecurityValidationResult(is_valid=True)
+
+def _split_url(url: str) -> Tuple[str, str, str]:
+    """
+    Split a URL into (scheme, host, path) without the general urlparse machinery.
+    
+    Query strings and fragments are dropped from the path, matching what
+    ``urlparse(url).path`` would return for the URLs we accept.
+    """
+    scheme, sep, rest = url.partition('://')
+    if not sep:
+        return '', '', url
+    
+    host_end = len(rest)
+    for delimiter in '/?#':
+        index = rest.find(delimiter)
+        if index != -1 and index < host_end:
+            host_end = index
+    
+    path = rest[host_end:].split('?', 1)[0].split('#', 1)[0]
+    return scheme, rest[:host_end], path
 
 def validate_file_extension(file_path: str) -> bool:
     """
@@ -139,27 +172,30 @@ def validate_file_extension(file_path: str) -> bool:
     Returns:
         True if extension is allowed, False otherwise
     """
-    _, ext = os.path.splitext(file_path.lower())
-    return ext in ALLOWED_EXTENSIONS
+    return os.path.splitext(file_path)[1].lower() in ALLOWED_EXTENSIONS
 
-def validate_file_size(file_path: str) -> SecurityValidationResult:
+def validate_file_size(file_path: str, entry: Optional[os.DirEntry] = None) -> SecurityValidationResult:
     """
     Validate if a file size is within allowed limits.
     
     Args:
         file_path: Path to the file
+        entry: Optional directory entry for the file (from ``os.scandir``),
+            whose cached stat result is reused instead of a new syscall
         
     Returns:
         SecurityValidationResult with validation status
     """
     try:
-        if not os.path.exists(file_path):
+        try:
+            stat_result = entry.stat() if entry is not None else os.stat(file_path)
+        except FileNotFoundError:
             return SecurityValidationResult(
                 is_valid=False,
                 error="File does not exist"
             )
         
-        file_size = os.path.getsize(file_path)
+        file_size = stat_result.st_size
         if file_size > MAX_FILE_SIZE:
             return SecurityValidationResult(
                 is_valid=False,
@@ -196,15 +232,8 @@ def sanitize_error_message(error: Exception) -> str:
     Returns:
         Sanitized error message
     """
-    error_str = str(error)
-    
-    # Remove sensitive information
-    sanitized = re.sub(r'[A-Za-z0-9+/]{20,}', '[REDACTED]', error_str)  # API keys/tokens
-    sanitized = re.sub(r'password[=:]\s*\S+', 'password=[REDACTED]', sanitized, flags=re.IGNORECASE)
-    sanitized = re.sub(r'token[=:]\s*\S+', 'token=[REDACTED]', sanitized, flags=re.IGNORECASE)
-    sanitized = re.sub(r'secret[=:]\s*\S+', 'secret=[REDACTED]', sanitized, flags=re.IGNORECASE)
-    
-    return sanitized
+    # Remove sensitive information in a single pass
+    return _SANITIZE_RE.sub(_redact_match, str(error))
 
 def validate_analysis_request(path: str, source_type: str) -> SecurityValidationResult:
     """
@@ -217,15 +246,19 @@ def validate_analysis_request(path: str, source_type: str) -> SecurityValidation
     Returns:
         SecurityValidationResult with validation status
     """
-    if source_type == 'local':
-        return validate_path(path)
-    elif source_type == 'github':
-        return validate_github_url(path)
-    else:
+    validator = _SOURCE_VALIDATORS.get(source_type)
+    if validator is None:
         return SecurityValidationResult(
             is_valid=False,
             error=f"Invalid source type: {source_type}. Must be 'local' or 'github'"
         )
+    return validator(path)
+
+# Validator for each accepted source_type, resolved with one lookup per request
+_SOURCE_VALIDATORS = {
+    'local': validate_path,
+    'github': validate_github_url,
+}
 
 def log_security_event(event_type: str, details: str, user_props: Optional[UserProps] = None):
     """
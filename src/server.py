@@ -2,398 +2,359 @@
 import asyncio
 import argparse
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Final, List, Literal, Optional
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 import os
+import re
 import sys
+import json
+import hashlib
+import threading
+import io
 from pathlib import Path
 
-# Add the parent directory to Python path so imports work correctly
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Now load environment variables
-from dotenv import load_dotenv
-env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(env_path)
+try:
+    import blake3
+except ImportError:
+    blake3 = None
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+import anyio
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.server.lowlevel.server import NotificationOptions
-from mcp.types import TextContent, Tool, JSONRPCError, INTERNAL_ERROR
-from pydantic import BaseModel, Field
-
-# Add debug print
-print(f"[DEBUG] Starting server from: {__file__}", file=sys.stderr)
-print(f"[DEBUG] Python path: {sys.path}", file=sys.stderr)
+from mcp.types import TextContent, Tool
+from pydantic import BaseModel, Field, TypeAdapter
 
-from src.tools.consolidated_documentation_tools import ConsolidatedDocumentationTools
-from src.analyzers.codebase_analyzer import CodebaseAnalyzer
-from src.generators.documentation_generator import DocumentationGenerator
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+class AnalyzeCodebaseArgs(BaseModel):
+    """Arguments accepted by the analyze_codebase tool, with server-side defaults."""
+    path: str = Field(description="Local folder path or GitHub repository URL")
+    source_type: Literal["local", "github"] = Field(description="Type of source to analyze")
+    include_dependencies: bool = Field(True, description="Whether to analyze dependencies")
+    include_ast_analysis: bool = Field(True, description="Whether to perform detailed AST parsing")
+    include_framework_detection: bool = Field(True, description="Whether to detect frameworks and tech stack")
+    include_database_analysis: bool = Field(True, description="Whether to analyze database schemas")
+    include_mermaid_diagrams: bool = Field(True, description="Whether to generate mermaid diagrams")
+    include_security_analysis: bool = Field(True, description="Whether to perform security analysis")
+    include_api_endpoints: bool = Field(True, description="Whether to extract API endpoints")
+    pagination_strategy: Literal["auto", "file_by_file", "chunk_by_chunk", "smart"] = Field(
+        "auto", description="Pagination strategy for large repositories"
+    )
+    max_files: int = Field(1000, description="Maximum number of files to analyze")
+    max_tokens_per_chunk: int = Field(4000, description="Maximum tokens per response chunk")
+    context_token: Optional[str] = Field(None, description="Pagination context token for continuing large analysis")
+    include_full_analysis: bool = Field(
+        True,
+        description="Whether to embed the full analysis in the response; when false only a summary is returned and the analysis stays available by analysis_id"
+    )
+    background_processing: bool = Field(
+        False,
+        description="Run the analysis in the background and return a task_id at once; collect the result with get_background_status"
+    )
+
+class GenerateDocumentationArgs(BaseModel):
+    """Arguments accepted by the generate_documentation tool, with server-side defaults."""
+    analysis_id: str = Field(description="ID of the previously analyzed codebase")
+    format: Literal[
+        "professional", "markdown", "html", "rst", "pdf", "interactive", "confluence", "notion", "docx", "epub", "json"
+    ] = Field("professional", description="Primary output format for documentation")
+    theme: Literal["default", "modern", "minimal", "dark", "corporate", "github", "material"] = Field(
+        "default", description="Documentation theme"
+    )
+    title: Optional[str] = Field(None, description="Custom title for documentation")
+    include_api_docs: bool = Field(True, description="Whether to include API documentation")
+    include_examples: bool = Field(True, description="Whether to include code examples")
+    include_architecture: bool = Field(True, description="Whether to include architecture diagrams")
+    include_mermaid_diagrams: bool = Field(True, description="Whether to include mermaid diagrams")
+    generate_interactive: bool = Field(True, description="Whether to generate an interactive HTML version")
+    include_search: bool = Field(True, description="Whether to include search functionality")
+    include_navigation: bool = Field(True, description="Whether to include navigation sidebar")
+    include_toc: bool = Field(True, description="Whether to include table of contents")
+    auto_export_formats: Optional[List[
+        Literal["html", "pdf", "docx", "markdown", "confluence", "notion", "json", "epub"]
+    ]] = Field(None, description="Additional formats to auto-export alongside primary format")
+    custom_css: Optional[str] = Field(None, description="Custom CSS to apply")
+    output_directory: str = Field("docs", description="Directory to save all documentation")
+
+class ExportDocumentationArgs(BaseModel):
+    """Arguments accepted by the export_documentation tool, with server-side defaults."""
+    analysis_id: str = Field(description="ID of previously completed analysis")
+    formats: List[Literal[
+        "html", "pdf", "docx", "markdown", "confluence", "notion", "json", "epub", "latex", "rtf", "odt"
+    ]] = Field(["html", "pdf"], description="Export formats - can export multiple formats simultaneously")
+    theme: Literal[
+        "default", "modern", "minimal", "dark", "corporate", "github", "material", "bootstrap", "academic"
+    ] = Field("default", description="Theme to use for all formats")
+    title: Optional[str] = Field(None, description="Custom title for documentation")
+    output_directory: str = Field("exports", description="Directory to save exported files")
+    include_toc: bool = Field(True, description="Whether to include table of contents")
+    include_diagrams: bool = Field(True, description="Whether to include interactive diagrams")
+    include_search: bool = Field(True, description="Whether to include search functionality (where supported)")
+    include_metadata: bool = Field(True, description="Whether to include document metadata")
+    include_analytics: bool = Field(False, description="Whether to include analytics tracking (for web formats)")
+    optimize_images: bool = Field(True, description="Whether to optimize embedded images for size")
+    minify_html: bool = Field(True, description="Whether to minify HTML and CSS output")
+    compress_output: bool = Field(
+        False,
+        description="Whether to gzip text-format exports (HTML, Markdown, JSON, ...) as <file>.gz; HTML stays uncompressed when generate_sitemap is set"
+    )
+    validate_output: bool = Field(True, description="Whether to validate all exported files")
+    generate_sitemap: bool = Field(True, description="Whether to generate an XML sitemap for HTML exports")
+    custom_css: Optional[str] = Field(None, description="Custom CSS to apply")
+    custom_header: Optional[str] = Field(None, description="Custom header content")
+    custom_footer: Optional[str] = Field(None, description="Custom footer content")
+    custom_logo: Optional[str] = Field(None, description="Custom logo image path")
+    watermark: Optional[str] = Field(None, description="Watermark text for documents")
+    split_large_files: bool = Field(True, description="Whether to split large outputs into multiple files")
+    generate_archive: bool = Field(False, description="Whether to create a ZIP archive of all exports")
+    include_source_code: bool = Field(True, description="Whether to include source code in exports")
+    include_raw_data: bool = Field(False, description="Whether to include raw analysis data")
+    include_diff_analysis: bool = Field(False, description="Whether to include diff analysis (if available)")
+    include_accessibility_features: bool = Field(True, description="Whether to add accessibility enhancements")
+    wcag_compliance_level: Literal["A", "AA", "AAA"] = Field("AA", description="WCAG compliance level")
+    include_print_styles: bool = Field(True, description="Whether to include print-friendly CSS")
+    languages: Optional[List[str]] = Field(None, description="Language codes to generate (multi-language export)")
+    default_language: str = Field("en", description="Default language for exports")
+
+class GetBackgroundStatusArgs(BaseModel):
+    """Arguments accepted by the get_background_status tool."""
+    task_id: str = Field(description="task_id returned when the background analysis was started")
+
+# Static tool definitions, built once at import and returned on every list_tools call.
+# Each inputSchema is generated from the argument model above, so the advertised
+# parameters and defaults are exactly the ones the server accepts
+_TOOLS: Final[List[Tool]] = [
+    Tool(
+        name="analyze_codebase",
+        description="Complete codebase analysis with ALL features built-in: AST parsing, framework detection, database analysis, mermaid diagrams, pagination, security analysis, API endpoints, dependencies, and more. This single tool replaces multiple separate calls with intelligent built-in processing.",
+        inputSchema=AnalyzeCodebaseArgs.model_json_schema()
+    ),
+    Tool(
+        name="generate_documentation",
+        description="Generate comprehensive professional documentation with ALL features built-in: multiple formats (HTML, PDF, Markdown, etc.), themes, interactive elements, search, navigation, code highlighting, auto-export, and more. Single comprehensive tool for all documentation needs.",
+        inputSchema=GenerateDocumentationArgs.model_json_schema()
+    ),
+    Tool(
+        name="export_documentation",
+        description="Export documentation to multiple formats with ALL advanced features built-in: image optimization, output compression, validation, accessibility features, multi-language export, custom styling, search functionality, interactive diagrams, print-friendly styles, sitemaps, archive generation, and more. Single comprehensive export tool for all needs.",
+        inputSchema=ExportDocumentationArgs.model_json_schema()
+    ),
+    Tool(
+        name="get_background_status",
+        description="Check on an analysis started with analyze_codebase(background_processing=true). Returns its status while it runs, and the full analysis response once it has finished.",
+        inputSchema=GetBackgroundStatusArgs.model_json_schema()
+    )
+]
+
+# Argument validators per tool, compiled once at import; unknown arguments are ignored
+_ADAPTERS: Dict[str, TypeAdapter] = {
+    "analyze_codebase": TypeAdapter(AnalyzeCodebaseArgs),
+    "generate_documentation": TypeAdapter(GenerateDocumentationArgs),
+    "export_documentation": TypeAdapter(ExportDocumentationArgs),
+    "get_background_status": TypeAdapter(GetBackgroundStatusArgs),
+}
+
+# Advertised inputSchemas compiled to straight-line validators, when fastjsonschema is installed.
+# These then replace the SDK's own jsonschema check of call_tool arguments, so each call is
+# schema-validated once; the TypeAdapters above only fill in defaults
+_SCHEMA_VALIDATORS: Dict[str, Any] = (
+    {tool.name: fastjsonschema.compile(tool.inputSchema, use_default=False) for tool in _TOOLS}
+    if fastjsonschema is not None else {}
+)
+
+# Tools whose successful results are memoized in DocumentAutomationServer._result_cache.
+# generate_documentation is left out: it writes files on every call, and its render is
+# already memoized per analysis by the documentation tools
+_CACHED_TOOLS = frozenset({"analyze_codebase"})
+
+# Maximum number of memoized tool results kept before evicting the least recently used
+RESULT_CACHE_MAXSIZE = 64
+
+# analysis_id embedded in an analyze_codebase response; background submissions carry
+# a task_id instead and are never cached
+_ANALYSIS_ID_RE = re.compile(r'"analysis_id":\s*"([^"]+)"')
+
+def _hash_bytes(data: bytes) -> str:
+    """Hex digest of data using BLAKE3 when installed, else BLAKE2b."""
+    if blake3 is not None:
+        return blake3.blake3(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=32).hexdigest()
+
+def _source_fingerprint(path: str) -> str:
+    """
+    Hash of file paths, sizes and mtimes under a local path, so edits invalidate cached results.
+
+    The whole tree is covered, since some analysis passes (file counts, database
+    schemas) read every directory, including venv and node_modules.
+    """
+    entries = []
+    stack = [path]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                dir_entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in dir_entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append(f"{entry.path}\0{st.st_size}\0{st.st_mtime_ns}")
+        # Reversed so subdirectories are visited in name order
+        stack.extend(reversed(subdirs))
+    return _hash_bytes("\n".join(entries).encode("utf-8", "surrogateescape"))
+
+def _cached_analysis_id(result: List[TextContent]) -> Optional[str]:
+    """The analysis an analyze_codebase result created, or None when the result must not be cached."""
+    match = _ANALYSIS_ID_RE.search(result[0].text)
+    return match.group(1) if match else None
+
+def _result_cache_key(name: str, kwargs: Dict[str, Any]) -> str:
+    """Cache key for a tool call: hash of the tool name and its normalized arguments."""
+    payload = {"tool": name, "arguments": kwargs}
+    if name == "analyze_codebase" and kwargs.get("source_type") == "local":
+        payload["source"] = _source_fingerprint(kwargs["path"])
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
+    else:
+        data = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return _hash_bytes(data)
+
+# Process-wide documentation tools, created on first use by get_tools()
+_TOOLS_SINGLETON = None
+_TOOLS_LOCK = threading.Lock()
+
+def get_tools():
+    """Return the shared ConsolidatedDocumentationTools, importing and creating it on first use."""
+    global _TOOLS_SINGLETON
+    if _TOOLS_SINGLETON is None:
+        with _TOOLS_LOCK:
+            if _TOOLS_SINGLETON is None:
+                from src.tools.consolidated_documentation_tools import ConsolidatedDocumentationTools
+                _TOOLS_SINGLETON = ConsolidatedDocumentationTools()
+    return _TOOLS_SINGLETON
+
+# Write buffer for the stdout side of the stdio transport; large enough that a
+# typical JSON-RPC frame is handed to the OS in one write when mcp flushes it
+STDOUT_BUFFER_SIZE = 64 * 1024
+
+def _buffered_stdout() -> "anyio.AsyncFile[str]":
+    """Async text stdout over a larger BufferedWriter, flushed by mcp after each message."""
+    raw = io.FileIO(sys.stdout.fileno(), "wb", closefd=False)
+    buffered = io.BufferedWriter(raw, buffer_size=STDOUT_BUFFER_SIZE)
+    # newline="\n" keeps Windows from rewriting JSON-RPC line endings as CRLF
+    return anyio.wrap_file(io.TextIOWrapper(buffered, encoding="utf-8", newline="\n", write_through=False))
+
 class DocumentAutomationServer:
+    # Read on every tool call; fixed slots avoid a per-instance __dict__
+    __slots__ = ("server", "documentation_tools", "_dispatch", "_result_cache", "_init_options")
+
     def __init__(self):
-        logger.info("[DEBUG] Initializing DocumentAutomationServer")
+        logger.debug("Initializing DocumentAutomationServer")
         self.server = Server("document-automation-server")
-        self.documentation_tools = ConsolidatedDocumentationTools()
+        # Resolved from get_tools() on first use so list_tools-only sessions skip the heavy imports
+        self.documentation_tools = None
+        self._dispatch: Optional[Dict[str, tuple]] = None
+        # cache key -> (analysis_id the result depends on, result)
+        self._result_cache: OrderedDict[str, tuple] = OrderedDict()
         self.setup_handlers()
-        logger.info("[DEBUG] Server initialization complete")
+        # Built after the handlers are registered, since capabilities are derived from them
+        self._init_options = InitializationOptions(
+            server_name="document-automation-server",
+            server_version="1.0.0",
+            capabilities=self.server.get_capabilities(
+                notification_options=NotificationOptions(),
+                experimental_capabilities={}
+            )
+        )
+        logger.debug("Server initialization complete")
+
+    def _get_dispatch(self) -> Dict[str, tuple]:
+        """
+        Tool name -> (handler, schema validator, argument adapter, cached), built on first use.
+
+        Everything handle_call_tool needs per tool is resolved here once, so a
+        call costs a single dict lookup before the handler runs.
+        """
+        if self._dispatch is None:
+            self.documentation_tools = get_tools()
+            self._dispatch = {
+                name: (
+                    getattr(self.documentation_tools, name),
+                    _SCHEMA_VALIDATORS.get(name),
+                    adapter,
+                    name in _CACHED_TOOLS,
+                )
+                for name, adapter in _ADAPTERS.items()
+            }
+        return self._dispatch
 
     def setup_handlers(self):
         @self.server.list_tools()
         async def handle_list_tools() -> List[Tool]:
-            logger.info("[DEBUG] handle_list_tools called")
-            tools = [
-                Tool(
-                    name="analyze_codebase",
-                    description="Complete codebase analysis with ALL features built-in: AST parsing, framework detection, database analysis, mermaid diagrams, pagination, security analysis, API endpoints, dependencies, and more. This single tool replaces multiple separate calls with intelligent built-in processing.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "path": {
-                                "type": "string",
-                                "description": "Local folder path or GitHub repository URL"
-                            },
-                            "source_type": {
-                                "type": "string",
-                                "enum": ["local", "github"],
-                                "description": "Type of source to analyze"
-                            },
-                            "include_dependencies": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to analyze dependencies"
-                            },
-                            "include_ast_analysis": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to perform detailed AST parsing"
-                            },
-                            "include_framework_detection": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to detect frameworks and tech stack"
-                            },
-                            "include_database_analysis": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to analyze database schemas"
-                            },
-                            "include_mermaid_diagrams": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to generate mermaid diagrams"
-                            },
-                            "include_security_analysis": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to perform security analysis"
-                            },
-                            "include_api_endpoints": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to extract API endpoints"
-                            },
-                            "pagination_strategy": {
-                                "type": "string",
-                                "enum": ["auto", "file_by_file", "chunk_by_chunk", "smart"],
-                                "default": "auto",
-                                "description": "Pagination strategy for large repositories"
-                            },
-                            "max_files": {
-                                "type": "integer",
-                                "default": 1000,
-                                "description": "Maximum number of files to analyze"
-                            },
-                            "max_tokens_per_chunk": {
-                                "type": "integer",
-                                "default": 4000,
-                                "description": "Maximum tokens per response chunk"
-                            },
-                            "context_token": {
-                                "type": "string",
-                                "description": "Pagination context token for continuing large analysis"
-                            }
-                        },
-                        "required": ["path", "source_type"]
-                    }
-                ),
-                Tool(
-                    name="generate_documentation",
-                    description="Generate comprehensive professional documentation with ALL features built-in: multiple formats (HTML, PDF, Markdown, etc.), themes, interactive elements, search, navigation, code highlighting, multi-language support, auto-export, accessibility compliance, responsive design, and more. Single comprehensive tool for all documentation needs.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "analysis_id": {
-                                "type": "string",
-                                "description": "ID of the previously analyzed codebase"
-                            },
-                            "format": {
-                                "type": "string",
-                                "enum": ["markdown", "html", "rst", "pdf", "interactive", "confluence", "notion", "docx", "epub", "json"],
-                                "default": "interactive",
-                                "description": "Primary output format for documentation"
-                            },
-                            "theme": {
-                                "type": "string",
-                                "enum": ["default", "modern", "minimal", "dark", "corporate", "github", "material"],
-                                "default": "modern",
-                                "description": "Documentation theme"
-                            },
-                            "title": {
-                                "type": "string",
-                                "description": "Custom title for documentation"
-                            },
-                            "include_api_docs": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to include API documentation"
-                            },
-                            "include_examples": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to include code examples"
-                            },
-                            "include_architecture": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to include architecture diagrams"
-                            },
-                            "include_mermaid_diagrams": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to include mermaid diagrams"
-                            },
-                            "include_search": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to include search functionality"
-                            },
-                            "include_navigation": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to include navigation sidebar"
-                            },
-                            "include_toc": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to include table of contents"
-                            },
-                            "auto_export_formats": {
-                                "type": "array",
-                                "items": {"type": "string", "enum": ["html", "pdf", "docx", "markdown", "confluence", "notion", "json", "epub"]},
-                                "description": "Additional formats to auto-export alongside primary format"
-                            },
-                            "custom_css": {
-                                "type": "string",
-                                "description": "Custom CSS to apply"
-                            },
-                            "accessibility_compliance": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to ensure accessibility compliance"
-                            },
-                            "multi_language_support": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to include multi-language support"
-                            }
-                        },
-                        "required": ["analysis_id"]
-                    }
-                ),
-                Tool(
-                    name="export_documentation",
-                    description="Export documentation to multiple formats with ALL advanced features built-in: quality optimization, accessibility compliance, multi-language support, custom branding, responsive design, search functionality, interactive diagrams, print-friendly styles, archive generation, batch processing, and more. Single comprehensive export tool for all needs.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "analysis_id": {
-                                "type": "string",
-                                "description": "ID of previously completed analysis"
-                            },
-                            "formats": {
-                                "type": "array",
-                                "items": {
-                                    "type": "string",
-                                    "enum": ["html", "pdf", "docx", "markdown", "confluence", "notion", "json", "epub", "latex", "rtf", "odt"]
-                                },
-                                "default": ["html", "pdf"],
-                                "description": "Export formats - can export multiple formats simultaneously"
-                            },
-                            "theme": {
-                                "type": "string",
-                                "enum": ["default", "modern", "minimal", "dark", "corporate", "github", "material", "bootstrap", "academic"],
-                                "default": "modern",
-                                "description": "Theme to use for all formats"
-                            },
-                            "title": {
-                                "type": "string",
-                                "description": "Custom title for documentation"
-                            },
-                            "include_toc": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to include table of contents"
-                            },
-                            "include_diagrams": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to include interactive diagrams"
-                            },
-                            "include_search": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to include search functionality"
-                            },
-                            "include_navigation": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to include navigation sidebar"
-                            },
-                            "accessibility_compliance": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to ensure WCAG 2.1 AA compliance"
-                            },
-                            "multi_language_support": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to include multi-language support"
-                            },
-                            "responsive_design": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to use responsive design"
-                            },
-                            "print_friendly": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to include print-friendly styles"
-                            },
-                            "custom_css": {
-                                "type": "string",
-                                "description": "Custom CSS to apply"
-                            },
-                            "custom_branding": {
-                                "type": "object",
-                                "properties": {
-                                    "logo_url": {"type": "string"},
-                                    "company_name": {"type": "string"},
-                                    "primary_color": {"type": "string"},
-                                    "secondary_color": {"type": "string"}
-                                },
-                                "description": "Custom branding options"
-                            },
-                            "output_directory": {
-                                "type": "string",
-                                "description": "Directory to save exported files"
-                            },
-                            "archive_formats": {
-                                "type": "array",
-                                "items": {"type": "string", "enum": ["zip", "tar", "tar.gz"]},
-                                "description": "Create archives of exported documentation"
-                            },
-                            "quality_optimization": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to optimize images and compress output"
-                            },
-                            "include_metadata": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to include document metadata"
-                            }
-                        },
-                        "required": ["analysis_id"]
-                    }
-                )
-            ]
-            logger.info(f"[DEBUG] Returning {len(tools)} tools")
-            print(f"[DEBUG] Returning {len(tools)} tools", file=sys.stderr)
-            return tools
+            return _TOOLS
 
-        @self.server.call_tool()
+        @self.server.call_tool(validate_input=not _SCHEMA_VALIDATORS)
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"[DEBUG] handle_call_tool called with name: {name}, arguments: {arguments}")
-            print(f"[DEBUG] handle_call_tool called with name: {name}, arguments: {arguments}", file=sys.stderr)
+            # Names arrive as fresh strings from JSON decoding; interning lets the
+            # dispatch lookup below match the table's keys by identity
+            name = sys.intern(name)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("handle_call_tool called with name: %s, arguments: %s", name, arguments)
             try:
-                if name == "analyze_codebase":
-                    return await self.documentation_tools.analyze_codebase(
-                        path=arguments["path"],
-                        source_type=arguments["source_type"],
-                        include_dependencies=arguments.get("include_dependencies", True),
-                        include_ast_analysis=arguments.get("include_ast_analysis", True),
-                        include_framework_detection=arguments.get("include_framework_detection", True),
-                        include_database_analysis=arguments.get("include_database_analysis", True),
-                        include_mermaid_diagrams=arguments.get("include_mermaid_diagrams", True),
-                        include_security_analysis=arguments.get("include_security_analysis", True),
-                        include_api_endpoints=arguments.get("include_api_endpoints", True),
-                        pagination_strategy=arguments.get("pagination_strategy", "auto"),
-                        max_files=arguments.get("max_files", 1000),
-                        max_tokens_per_chunk=arguments.get("max_tokens_per_chunk", 4000),
-                        context_token=arguments.get("context_token")
-                    )
-                elif name == "generate_documentation":
-                    return await self.documentation_tools.generate_documentation(
-                        analysis_id=arguments["analysis_id"],
-                        format=arguments.get("format", "professional"),
-                        theme=arguments.get("theme", "default"),
-                        title=arguments.get("title"),
-                        include_api_docs=arguments.get("include_api_docs", True),
-                        include_examples=arguments.get("include_examples", True),
-                        include_architecture=arguments.get("include_architecture", True),
-                        include_mermaid_diagrams=arguments.get("include_mermaid_diagrams", True),
-                        generate_interactive=arguments.get("generate_interactive", True),
-                        include_search=arguments.get("include_search", True),
-                        include_navigation=arguments.get("include_navigation", True),
-                        include_toc=arguments.get("include_toc", True),
-                        auto_export_formats=arguments.get("auto_export_formats", []),
-                        custom_css=arguments.get("custom_css"),
-                        output_directory=arguments.get("output_directory", "docs")
-                    )
-                elif name == "export_documentation":
-                    return await self.documentation_tools.export_documentation(
-                        analysis_id=arguments["analysis_id"],
-                        formats=arguments.get("formats", ["html", "pdf"]),
-                        theme=arguments.get("theme", "default"),
-                        title=arguments.get("title"),
-                        output_directory=arguments.get("output_directory", "exports"),
-                        include_toc=arguments.get("include_toc", True),
-                        include_diagrams=arguments.get("include_diagrams", True),
-                        include_search=arguments.get("include_search", True),
-                        include_metadata=arguments.get("include_metadata", True),
-                        include_analytics=arguments.get("include_analytics", False),
-                        optimize_images=arguments.get("optimize_images", True),
-                        minify_html=arguments.get("minify_html", True),
-                        compress_output=arguments.get("compress_output", False),
-                        validate_output=arguments.get("validate_output", True),
-                        generate_sitemap=arguments.get("generate_sitemap", True),
-                        custom_css=arguments.get("custom_css"),
-                        custom_header=arguments.get("custom_header"),
-                        custom_footer=arguments.get("custom_footer"),
-                        custom_logo=arguments.get("custom_logo"),
-                        watermark=arguments.get("watermark"),
-                        split_large_files=arguments.get("split_large_files", True),
-                        generate_archive=arguments.get("generate_archive", False),
-                        include_source_code=arguments.get("include_source_code", True),
-                        include_raw_data=arguments.get("include_raw_data", False),
-                        include_diff_analysis=arguments.get("include_diff_analysis", False),
-                        include_accessibility_features=arguments.get("include_accessibility_features", True),
-                        wcag_compliance_level=arguments.get("wcag_compliance_level", "AA"),
-                        include_print_styles=arguments.get("include_print_styles", True),
-                        languages=arguments.get("languages"),
-                        default_language=arguments.get("default_language", "en")
-                    )
-                else:
-                    raise JSONRPCError(INTERNAL_ERROR, f"Unknown tool: {name}")
-
+                route = self._get_dispatch().get(name)
+                if route is None:
+                    raise ValueError(f"Unknown tool: {name}")
+                handler, schema_validator, adapter, cached_tool = route
+                if schema_validator is not None:
+                    try:
+                        schema_validator(arguments or {})
+                    except fastjsonschema.JsonSchemaException as e:
+                        raise ValueError(f"Invalid arguments for {name}: {e}") from e
+                kwargs = adapter.validate_python(arguments or {}).model_dump()
+                cache_key = None
+                if cached_tool:
+                    cache_key = await asyncio.to_thread(_result_cache_key, name, kwargs)
+                    cached = self._result_cache.get(cache_key)
+                    if cached is not None:
+                        # A result is only valid while the tools still hold its analysis;
+                        # this also ties entries to the analysis cache's TTL and clearing
+                        analysis_id, cached_result = cached
+                        if analysis_id in self.documentation_tools.analysis_cache:
+                            self._result_cache.move_to_end(cache_key)
+                            return cached_result
+                        del self._result_cache[cache_key]
+                result = await handler(**kwargs)
+                if cache_key is not None and result and not result[0].text.startswith("**Error**"):
+                    analysis_id = _cached_analysis_id(result)
+                    if analysis_id is not None:
+                        self._result_cache[cache_key] = (analysis_id, result)
+                        if len(self._result_cache) > RESULT_CACHE_MAXSIZE:
+                            self._result_cache.popitem(last=False)
+                return result
             except Exception as e:
-                logger.error(f"Error in tool {name}: {str(e)}")
-                raise JSONRPCError(INTERNAL_ERROR, f"Tool execution failed: {str(e)}")
+                # Re-raised for the SDK, which returns it to the client as an error result
+                logger.error("Error in tool %s: %s", name, e)
+                raise
         
         @self.server.list_prompts()
         async def handle_list_prompts():
@@ -405,38 +366,71 @@ class DocumentAutomationServer:
             """Handle resources list request"""
             return []
 
+    async def _warmup(self):
+        """Create and warm the shared tools in the background; failures only cost the first call."""
+        try:
+            tools = await asyncio.to_thread(get_tools)
+            await tools.warmup()
+        except Exception as e:
+            logger.warning("Tool warmup failed: %s", e)
+
     async def run(self):
-        logger.info("[DEBUG] Starting server run")
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="document-automation-server",
-                    server_version="1.0.0",
-                    capabilities=self.server.get_capabilities(
-                        notification_options=NotificationOptions(),
-                        experimental_capabilities={}
-                    )
-                )
-            )
+        logger.debug("Starting server run")
+        # Handlers that finish without awaiting run inline instead of taking a
+        # trip through the ready queue (asyncio.eager_task_factory is 3.12+)
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            asyncio.get_running_loop().set_task_factory(eager_task_factory)
+        async with stdio_server(stdout=_buffered_stdout()) as (read_stream, write_stream):
+            # Started after the streams open and not awaited, so list_tools is never held up
+            warmup_task = asyncio.create_task(self._warmup())
+            try:
+                await self.server.run(read_stream, write_stream, self._init_options)
+            finally:
+                # Settle the warm-up before the loop closes so it is never destroyed pending
+                # (gather collects its CancelledError without swallowing our own cancellation)
+                warmup_task.cancel()
+                await asyncio.gather(warmup_task, return_exceptions=True)
+
+def _run_event_loop(coro):
+    """Run the server coroutine on uvloop when it is installed, else on asyncio's default loop."""
+    # uvloop is POSIX-only; Windows keeps its default proactor loop
+    if sys.platform == "win32":
+        return asyncio.run(coro)
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    if hasattr(uvloop, "run"):
+        return uvloop.run(coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
 
 def main():
-    print("[INFO] MCP Document Automation Server starting...", file=sys.stderr)
     parser = argparse.ArgumentParser(description="Document Automation MCP Server")
-    parser.add_argument("--log-level", default="INFO", help="Set the logging level")
+    parser.add_argument("--log-level", default="WARNING", help="Set the logging level")
     args = parser.parse_args()
 
-    logging.basicConfig(level=getattr(logging, args.log_level.upper()))
+    from dotenv import load_dotenv
+    load_dotenv(Path(__file__).parent.parent / '.env')
+
+    # Configured here rather than at import so embedding the module leaves logging alone
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper()),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logger.info("MCP Document Automation Server starting...")
 
     try:
         server = DocumentAutomationServer()
-        print("[INFO] Server initialized, starting MCP communication...", file=sys.stderr)
-        asyncio.run(server.run())
+        logger.info("Server initialized, starting MCP communication...")
+        _run_event_loop(server.run())
     except Exception as e:
-        print(f"[ERROR] Server failed to start: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc(file=sys.stderr)
+        logger.exception("Server failed to start: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
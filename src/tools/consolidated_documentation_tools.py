@@ -12,10 +12,22 @@ Each tool automatically handles pagination, chunking, and includes all sub-featu
 """
 
 import os
+import sys
 import asyncio
+import bisect
+import functools
+import gzip
+import itertools
 import logging
-from typing import Dict, Any, List, Optional, Union
+import secrets
+import shutil
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
+from pathlib import PurePosixPath
 
 from mcp.types import TextContent
 
@@ -32,6 +44,187 @@ from src.security.validation import validate_analysis_request
 
 logger = logging.getLogger(__name__)
 
+# Bounds for the per-process analysis cache; entries are dropped after the TTL or
+# when the cache is full, least recently used first
+ANALYSIS_CACHE_SIZE = int(os.getenv("DOC_CACHE_SIZE", "32"))
+ANALYSIS_CACHE_TTL = 3600.0
+
+# Upper bounds on concurrently running exports (file renders and writes) and
+# diagram builds when those phases are gathered
+EXPORT_CONCURRENCY = int(os.getenv("DOC_EXPORT_PAR", "4"))
+DIAGRAM_CONCURRENCY = os.cpu_count() or 4
+
+# Common file and folder names run through the content filter at warmup to prime its caches
+WARMUP_FILENAMES = (
+    'main.py', 'setup.py', '__init__.py', 'index.js', 'package.json', 'requirements.txt',
+    'README.md', 'Dockerfile', 'pyproject.toml', 'tsconfig.json', '.env', 'config.yaml'
+)
+WARMUP_FOLDERS = ('src', 'tests', 'docs', 'node_modules', '.git', '__pycache__', 'venv', 'build', 'dist')
+
+# Chunk size for scanning exported files during validation, and the markers an
+# HTML export must contain; files are read incrementally rather than whole
+EXPORT_SCAN_CHUNK = 64 * 1024
+HTML_REQUIRED_MARKERS = (
+    ('<!DOCTYPE html>', 'Missing DOCTYPE declaration'),
+    ('<html', 'Missing HTML tag'),
+    ('<title>', 'Missing title tag'),
+)
+
+# Text formats gzip-compressed in place when export_documentation runs with
+# compress_output, and the zlib level used for them and for export archives
+COMPRESSIBLE_FORMATS = frozenset({
+    'html', 'markdown', 'md', 'json', 'xml', 'latex', 'confluence', 'notion',
+    'gitbook', 'sphinx', 'jekyll', 'hugo'
+})
+EXPORT_COMPRESS_LEVEL = 6
+
+# Upper bounds of the low, medium and high complexity bands; scores above the
+# last edge are very_high
+COMPLEXITY_BAND_EDGES = (10, 25, 50)
+COMPLEXITY_BANDS = ('low', 'medium', 'high', 'very_high')
+
+# Keys whose string values repeat across thousands of per-file and per-symbol entries;
+# the values are interned so each distinct one is held once
+_HOT_KEYS = frozenset(map(sys.intern, (
+    'file', 'name', 'type', 'path', 'complexity', 'language', 'framework', 'endpoint', 'method'
+)))
+
+class AnalysisCache:
+    """
+    Bounded store for comprehensive analysis results.
+
+    Keeps at most ``maxsize`` entries, evicting the least recently used, and
+    drops any entry older than ``ttl`` seconds. Supports the dict operations
+    the tools use: ``in``, indexing, assignment, ``del``, ``get``, ``clear``,
+    ``keys`` and ``values``.
+    """
+
+    def __init__(self, maxsize: int = ANALYSIS_CACHE_SIZE, ttl: float = ANALYSIS_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def _purge_expired(self) -> None:
+        cutoff = time.monotonic() - self.ttl
+        for key in [key for key, (stored_at, _) in self._data.items() if stored_at < cutoff]:
+            del self._data[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if entry[0] < time.monotonic() - self.ttl:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Dict[str, Any]) -> None:
+        self._purge_expired()
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            evicted, _ = self._data.popitem(last=False)
+            logger.info(f"Evicted analysis {evicted} from cache")
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __len__(self) -> int:
+        self._purge_expired()
+        return len(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def keys(self) -> List[str]:
+        self._purge_expired()
+        return list(self._data.keys())
+
+    def values(self) -> Iterator[Dict[str, Any]]:
+        self._purge_expired()
+        return (value for _, value in self._data.values())
+
+# Sentinel for AnalysisCache lookups, since a cached value may itself be falsy
+_MISSING = object()
+
+@dataclass(slots=True, kw_only=True)
+class ExportedFile:
+    """One file written by an export, or a failed attempt at one."""
+    format: str
+    path: Optional[str] = None
+    size: Union[int, str, None] = None
+    status: str
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in ExportedFile.__slots__ if getattr(self, name) is not None}
+
+@dataclass(slots=True, kw_only=True)
+class GeneratedFile(ExportedFile):
+    """One documentation file produced by generate_documentation."""
+    type: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'type': self.type, **ExportedFile.to_dict(self)}
+
+# Per-process generator used by _run_generator_in_worker on the process pool
+_worker_doc_generator: Optional[ProfessionalDocumentationGenerator] = None
+
+def _run_generator_in_worker(method: str, kwargs: Dict[str, Any]) -> Any:
+    """Process-pool entry point: call a ProfessionalDocumentationGenerator method in the worker."""
+    global _worker_doc_generator
+    if _worker_doc_generator is None:
+        _worker_doc_generator = ProfessionalDocumentationGenerator()
+    return getattr(_worker_doc_generator, method)(**kwargs)
+
+def _intern_hot_values(data: Any) -> None:
+    """Intern string values stored under _HOT_KEYS throughout a nested analysis result, in place."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if isinstance(value, str):
+                    if key in _HOT_KEYS:
+                        node[key] = sys.intern(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+
+def _project_name(path: str, default: str = "") -> str:
+    """Last component of a repository URL or local path, ignoring trailing and Windows separators."""
+    return PurePosixPath(path.replace('\\', '/').rstrip('/')).name or default or path
+
+@functools.lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _project_title(path: str) -> str:
+    """Display title for a project path; a pure function of the path, so safe to share across analyses."""
+    return _project_name(path).replace('-', ' ').replace('_', ' ').title()
+
+def _run_analyzer_phase(phase) -> Any:
+    """Run one of CodebaseAnalyzer's blocking async passes to completion on the calling worker thread."""
+    return asyncio.run(phase())
+
+@functools.lru_cache(maxsize=64)
+def _analysis_not_found_content(analysis_id: str) -> TextContent:
+    """Shared error content for an unknown analysis_id; responses are never mutated downstream."""
+    return TextContent(
+        type="text",
+        text=create_error_response(
+            f"Analysis ID {analysis_id} not found. Please run analyze_codebase first."
+        ).content[0].text
+    )
+
 class ConsolidatedDocumentationTools:
     """
     Consolidated documentation tools with all functionality integrated.
@@ -42,11 +235,46 @@ class ConsolidatedDocumentationTools:
     3. export_documentation - Multi-format export with all options
     """
     
-    def __init__(self):
-        """Initialize the consolidated documentation tools."""
-        self.analysis_cache = {}  # Cache for analysis results
+    def __init__(self, use_processes: bool = False):
+        """
+        Initialize the consolidated documentation tools.
+        
+        Args:
+            use_processes: Render and export documents on a process pool instead of
+                worker threads, so CPU-bound rendering scales across cores
+        """
+        self.analysis_cache = AnalysisCache()  # Bounded LRU + TTL cache for analysis results
+        self.rendered_docs = AnalysisCache()  # analysis_id -> markdown from generate_documentation
+        self._background_tasks: Dict[str, asyncio.Task] = {}  # task_id -> running background analysis
+        self._background_results = AnalysisCache()  # task_id -> finished response, until collected or expired
+        self._id_counter = itertools.count()  # Sequence part of generated analysis IDs
+        self._export_semaphore = asyncio.Semaphore(EXPORT_CONCURRENCY)
+        self._diagram_semaphore = asyncio.Semaphore(DIAGRAM_CONCURRENCY)
+        self.use_processes = use_processes
+        self._process_pool: Optional[ProcessPoolExecutor] = None  # Created on first use
         self.doc_generator = ProfessionalDocumentationGenerator()
         self.mermaid_generator = MermaidGenerator()
+
+    async def warmup(self) -> None:
+        """
+        Pay one-time costs ahead of the first analyze_codebase call.
+
+        Imports the enhanced analyzer stack that CodebaseAnalyzer loads lazily
+        and primes the content filter's per-name lookup caches.
+        """
+        await asyncio.to_thread(self._warm_caches)
+
+    def _warm_caches(self) -> None:
+        from src.analyzers import enhanced_analyzer  # noqa: F401
+
+        content_filter = getattr(self.doc_generator, 'content_filter', None)
+        if content_filter is None:
+            return
+        for filename in WARMUP_FILENAMES:
+            content_filter.should_include_in_docs(filename)
+            content_filter.get_safe_file_description(filename)
+        for folder in WARMUP_FOLDERS:
+            content_filter.is_excluded_folder(folder)
         
     async def analyze_codebase(
         self,
@@ -69,7 +297,8 @@ class ConsolidatedDocumentationTools:
         # Output options (built-in)
         generate_preview_docs: bool = False,
         auto_export_formats: Optional[List[str]] = None,
-        create_interactive_preview: bool = False
+        create_interactive_preview: bool = False,
+        include_full_analysis: bool = True
     ) -> List[TextContent]:
         """
         Complete codebase analysis with ALL features integrated automatically.
@@ -106,12 +335,14 @@ class ConsolidatedDocumentationTools:
             generate_preview_docs: Auto-generate preview documentation
             auto_export_formats: Auto-export to formats ['html', 'md', 'pdf']
             create_interactive_preview: Create interactive HTML preview
+            include_full_analysis: Embed the full analysis in the response; when False
+                only the summary is returned and the analysis is fetched by analysis_id
             
         Returns:
             Comprehensive analysis results with all requested features
         """
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             logger.info(f"Starting comprehensive analysis for {source_type}: {path}")
             
             # Validate the request
@@ -124,6 +355,43 @@ class ConsolidatedDocumentationTools:
                     ).content[0].text
                 )]
             
+            # Handle pagination automatically. The background branch needs no analyzer
+            # of its own: the detached call below builds one when it runs
+            if background_processing:
+                # Submit as background task for very large repos and return at once;
+                # the result is collected later with get_background_status(task_id)
+                task_id = self._generate_analysis_id(path)
+                logger.info(f"Submitting analysis {task_id} for background processing")
+                
+                task = self._background_tasks[task_id] = asyncio.create_task(self.analyze_codebase(
+                    path=path,
+                    source_type=source_type,
+                    include_dependencies=include_dependencies,
+                    include_ast_analysis=include_ast_analysis,
+                    include_framework_detection=include_framework_detection,
+                    include_database_analysis=include_database_analysis,
+                    include_mermaid_diagrams=include_mermaid_diagrams,
+                    include_api_endpoints=include_api_endpoints,
+                    include_security_analysis=include_security_analysis,
+                    max_files=max_files,
+                    context_token=context_token,
+                    background_processing=False,
+                    max_tokens_per_chunk=max_tokens_per_chunk,
+                    pagination_strategy=pagination_strategy,
+                    generate_preview_docs=generate_preview_docs,
+                    auto_export_formats=auto_export_formats,
+                    create_interactive_preview=create_interactive_preview,
+                    include_full_analysis=include_full_analysis
+                ))
+                task.add_done_callback(functools.partial(self._finish_background_task, task_id))
+                return [TextContent(
+                    type="text",
+                    text=create_success_response(
+                        f"Background analysis {task_id} started",
+                        {'task_id': task_id, 'status': 'running'}
+                    ).content[0].text
+                )]
+            
             # Create comprehensive analyzer configuration
             analyzer_config = {
                 'include_dependencies': include_dependencies,
@@ -146,17 +414,8 @@ class ConsolidatedDocumentationTools:
                 config=analyzer_config
             )
             
-            # Handle pagination automatically
-            if background_processing:
-                # Submit as background task for very large repos
-                task_id = self._generate_analysis_id(path)
-                logger.info(f"Submitting analysis {task_id} for background processing")
-                
-                # Start background processing (mock implementation)
-                analysis_result = await analyzer.analyze()  # In real implementation, this would be async
-            else:
-                # Regular analysis with automatic pagination
-                analysis_result = await analyzer.analyze()
+            # Regular analysis with automatic pagination
+            analysis_result = await analyzer.analyze()
             
             if not analysis_result.success:
                 return [TextContent(
@@ -166,30 +425,49 @@ class ConsolidatedDocumentationTools:
                     ).content[0].text
                 )]
             
-            # Enhanced analysis with all additional features
-            comprehensive_data = {**analysis_result.data}
+            # Enhanced analysis with all additional features. The result's data dict
+            # is freshly built for this call and not shared, so extend it in place
+            comprehensive_data = analysis_result.data
             
-            # 1. Framework detection (if enabled)
+            # 1-3. Framework, database and AST passes are independent blocking
+            # reads of the same tree, so they run side by side on worker threads
+            phases = []
             if include_framework_detection:
                 logger.info("Detecting frameworks and technology stack...")
-                frameworks = await analyzer._detect_frameworks()
+                phases.append(analyzer._detect_frameworks)
+            if include_database_analysis:
+                logger.info("Analyzing database schemas...")
+                phases.append(analyzer._analyze_database_schemas)
+            if include_ast_analysis:
+                logger.info("Performing AST analysis with complexity metrics...")
+                phases.append(analyzer._parse_code_ast)
+            if phases:
+                # List the tree once up front, so the passes share it instead of each
+                # walking it on an empty cache
+                await asyncio.to_thread(analyzer._list_tree)
+            phase_results = dict(zip(phases, await asyncio.gather(
+                *(asyncio.to_thread(_run_analyzer_phase, phase) for phase in phases)
+            )))
+            
+            # 1. Framework detection (if enabled)
+            if include_framework_detection:
+                frameworks = phase_results[analyzer._detect_frameworks]
                 comprehensive_data['frameworks'] = frameworks
                 comprehensive_data['technology_stack'] = self._create_tech_stack_summary(frameworks)
             
             # 2. Database analysis (if enabled)
             if include_database_analysis:
-                logger.info("Analyzing database schemas...")
-                db_schemas = await analyzer._analyze_database_schemas()
+                db_schemas = phase_results[analyzer._analyze_database_schemas]
                 comprehensive_data['database_schemas'] = db_schemas
                 comprehensive_data['database_summary'] = self._create_database_summary(db_schemas)
             
             # 3. AST analysis with complexity metrics (if enabled)
             if include_ast_analysis:
-                logger.info("Performing AST analysis with complexity metrics...")
-                ast_data = await analyzer._parse_code_ast()
+                ast_data = phase_results[analyzer._parse_code_ast]
                 comprehensive_data['ast_analysis'] = ast_data
-                comprehensive_data['code_metrics'] = self._calculate_comprehensive_metrics(ast_data)
-                comprehensive_data['complexity_analysis'] = self._analyze_code_complexity(ast_data)
+                code_metrics, complexity_analysis = self._calculate_code_metrics(ast_data)
+                comprehensive_data['code_metrics'] = code_metrics
+                comprehensive_data['complexity_analysis'] = complexity_analysis
             
             # 4. Generate all mermaid diagrams automatically (if enabled)
             diagrams = {}
@@ -199,14 +477,17 @@ class ConsolidatedDocumentationTools:
                 # Generate all diagram types automatically
                 diagram_types = ['architecture', 'dependencies', 'file_structure', 'api_flow', 'database_er']
                 
-                for diagram_type in diagram_types:
-                    try:
-                        diagrams[diagram_type] = await self._generate_diagram(
-                            diagram_type, comprehensive_data, path
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to generate {diagram_type} diagram: {e}")
-                        diagrams[diagram_type] = f"// Error: {str(e)}"
+                results = await asyncio.gather(
+                    *(self._generate_diagram_bounded(diagram_type, comprehensive_data, path)
+                      for diagram_type in diagram_types),
+                    return_exceptions=True
+                )
+                for diagram_type, result in zip(diagram_types, results):
+                    if isinstance(result, Exception):
+                        logger.warning(f"Failed to generate {diagram_type} diagram: {result}")
+                        diagrams[diagram_type] = f"// Error: {str(result)}"
+                    else:
+                        diagrams[diagram_type] = result
             
             comprehensive_data['mermaid_diagrams'] = diagrams
             
@@ -216,7 +497,8 @@ class ConsolidatedDocumentationTools:
                 security_analysis = self._perform_security_analysis(comprehensive_data)
                 comprehensive_data['security_analysis'] = security_analysis
             
-            # Cache the comprehensive results
+            # Cache the comprehensive results, sharing the repeated language/type/name strings
+            _intern_hot_values(comprehensive_data)
             analysis_id = analyzer.analysis_id
             self.analysis_cache[analysis_id] = comprehensive_data
             
@@ -225,11 +507,13 @@ class ConsolidatedDocumentationTools:
             if generate_preview_docs:
                 logger.info("Generating preview documentation...")
                 try:
+                    project_root = getattr(analyzer, 'working_path', '')
+                    repo_url = path if source_type == 'github' else ''
                     preview_docs = self.doc_generator.generate_documentation(
                         analysis_result=comprehensive_data,
-                        project_root=getattr(analyzer, 'working_path', ''),
+                        project_root=project_root,
                         output_path=f"docs/preview_{analysis_id}.md",
-                        repo_url=path if source_type == 'github' else ''
+                        repo_url=repo_url
                     )
                 except Exception as e:
                     logger.warning(f"Preview documentation generation failed: {e}")
@@ -238,37 +522,43 @@ class ConsolidatedDocumentationTools:
             exported_files = []
             if auto_export_formats:
                 logger.info(f"Auto-exporting to {len(auto_export_formats)} formats...")
-                for format_type in auto_export_formats:
-                    try:
-                        export_path = f"docs/{analysis_id}_auto_export.{format_type}"
-                        exported_content = self.doc_generator.export_documentation(
-                            analysis_result=comprehensive_data,
+                export_paths = [f"docs/{analysis_id}_auto_export.{format_type}" for format_type in auto_export_formats]
+                # Each export renders and writes a file; run them side by side off the event loop
+                results = await asyncio.gather(
+                    *(self._export_in_thread(
+                        analysis_result=comprehensive_data,
+                        format=format_type,
+                        output_path=export_path
+                    ) for format_type, export_path in zip(auto_export_formats, export_paths)),
+                    return_exceptions=True
+                )
+                for format_type, export_path, exported_content in zip(auto_export_formats, export_paths, results):
+                    if isinstance(exported_content, Exception):
+                        logger.warning(f"Auto-export to {format_type} failed: {exported_content}")
+                        exported_files.append(ExportedFile(
                             format=format_type,
-                            output_path=export_path
-                        )
-                        exported_files.append({
-                            'format': format_type,
-                            'path': export_path,
-                            'size': len(exported_content) if isinstance(exported_content, str) else 'N/A',
-                            'status': 'success'
-                        })
-                    except Exception as e:
-                        logger.warning(f"Auto-export to {format_type} failed: {e}")
-                        exported_files.append({
-                            'format': format_type,
-                            'status': 'failed',
-                            'error': str(e)
-                        })
+                            status='failed',
+                            error=str(exported_content)
+                        ))
+                    else:
+                        exported_files.append(ExportedFile(
+                            format=format_type,
+                            path=export_path,
+                            size=len(exported_content) if isinstance(exported_content, str) else 'N/A',
+                            status='success'
+                        ))
             
             # 8. Create interactive preview (if requested)
             interactive_preview_path = None
+            interactive_preview_url = None
             if create_interactive_preview:
                 logger.info("Creating interactive preview...")
                 try:
                     interactive_preview_path = f"docs/{analysis_id}_interactive.html"
+                    interactive_preview_url = f"file://{os.path.abspath(interactive_preview_path)}"
                     interactive_content = self.doc_generator.generate_interactive_documentation(
                         analysis_result=comprehensive_data,
-                        title=f"Interactive Analysis: {path.split('/')[-1] if '/' in path else path}",
+                        title=f"Interactive Analysis: {_project_name(path)}",
                         theme="default",
                         include_search=True,
                         include_navigation=True,
@@ -278,8 +568,17 @@ class ConsolidatedDocumentationTools:
                 except Exception as e:
                     logger.warning(f"Interactive preview creation failed: {e}")
             
-            # Calculate final statistics
-            duration = (datetime.now() - start_time).total_seconds()
+            # Calculate final statistics, reading each collection once for both
+            # the feature summary and the statistics block
+            duration = time.perf_counter() - start_time
+            project_structure = comprehensive_data.get('project_structure', {})
+            dependency_count = len(comprehensive_data.get('dependencies', []))
+            framework_count = len(comprehensive_data.get('frameworks', []))
+            database_schemas = comprehensive_data.get('database_schemas', [])
+            table_count = sum(len(schema.get('tables', ())) for schema in database_schemas)
+            ast_count = len(comprehensive_data.get('ast_analysis', []))
+            endpoint_count = len(comprehensive_data.get('api_endpoints', []))
+            security_analysis = comprehensive_data.get('security_analysis')
             
             # Prepare comprehensive response with all results
             response_data = {
@@ -289,19 +588,23 @@ class ConsolidatedDocumentationTools:
                 'source_type': source_type,
                 'duration_seconds': round(duration, 2),
                 
-                # Core analysis results
-                'comprehensive_analysis': comprehensive_data,
+                # Core analysis results; the full dict can dwarf the rest of the payload,
+                # so callers may leave it in the cache and refer to it by analysis_id
+                'comprehensive_analysis': comprehensive_data if include_full_analysis else {
+                    'analysis_id': analysis_id,
+                    'cached': True
+                },
                 
                 # Feature summary
                 'features_analyzed': {
                     'project_structure': True,
-                    'dependencies': include_dependencies and len(comprehensive_data.get('dependencies', [])) > 0,
-                    'frameworks': include_framework_detection and len(comprehensive_data.get('frameworks', [])) > 0,
-                    'database_schemas': include_database_analysis and len(comprehensive_data.get('database_schemas', [])) > 0,
-                    'ast_analysis': include_ast_analysis and len(comprehensive_data.get('ast_analysis', [])) > 0,
-                    'api_endpoints': include_api_endpoints and len(comprehensive_data.get('api_endpoints', [])) > 0,
-                    'security_analysis': include_security_analysis and comprehensive_data.get('security_analysis'),
-                    'mermaid_diagrams': include_mermaid_diagrams and len(diagrams) > 0
+                    'dependencies': include_dependencies and bool(dependency_count),
+                    'frameworks': include_framework_detection and bool(framework_count),
+                    'database_schemas': include_database_analysis and bool(database_schemas),
+                    'ast_analysis': include_ast_analysis and bool(ast_count),
+                    'api_endpoints': include_api_endpoints and bool(endpoint_count),
+                    'security_analysis': include_security_analysis and bool(security_analysis),
+                    'mermaid_diagrams': include_mermaid_diagrams and bool(diagrams)
                 },
                 
                 # Diagrams (if generated)
@@ -314,23 +617,23 @@ class ConsolidatedDocumentationTools:
                     'preview': preview_docs[:500] + "..." if preview_docs and len(preview_docs) > 500 else preview_docs
                 } if generate_preview_docs else None,
                 
-                'auto_exported_files': exported_files,
-                'export_count': len([f for f in exported_files if f.get('status') == 'success']),
+                'auto_exported_files': [f.to_dict() for f in exported_files],
+                'export_count': len([f for f in exported_files if f.status == 'success']),
                 
                 'interactive_preview': {
                     'generated': interactive_preview_path is not None,
                     'path': interactive_preview_path,
-                    'url': f"file://{os.path.abspath(interactive_preview_path)}" if interactive_preview_path else None
+                    'url': interactive_preview_url
                 } if create_interactive_preview else None,
                 
                 # Analysis statistics
                 'analysis_statistics': {
-                    'total_files': comprehensive_data.get('project_structure', {}).get('total_files', 0),
-                    'analyzed_files': len(comprehensive_data.get('project_structure', {}).get('files', [])),
-                    'frameworks_detected': len(comprehensive_data.get('frameworks', [])),
-                    'database_tables': len([table for schema in comprehensive_data.get('database_schemas', []) for table in schema.get('tables', [])]),
-                    'api_endpoints_found': len(comprehensive_data.get('api_endpoints', [])),
-                    'security_issues': len(comprehensive_data.get('security_analysis', {}).get('issues', [])),
+                    'total_files': project_structure.get('total_files', 0),
+                    'analyzed_files': len(project_structure.get('files', [])),
+                    'frameworks_detected': framework_count,
+                    'database_tables': table_count,
+                    'api_endpoints_found': endpoint_count,
+                    'security_issues': len((security_analysis if security_analysis is not None else {}).get('issues', [])),
                     'code_complexity': comprehensive_data.get('complexity_analysis', {}).get('overall_complexity', 'unknown')
                 },
                 
@@ -345,12 +648,16 @@ class ConsolidatedDocumentationTools:
                 }
             }
             
+            # The payload can run to megabytes on large repos; serialize it off
+            # the event loop so other requests keep being served meanwhile
+            response = await asyncio.to_thread(
+                create_success_response,
+                f"Comprehensive analysis completed in {duration:.2f}s with {len([k for k, v in response_data['features_analyzed'].items() if v])} features",
+                response_data
+            )
             return [TextContent(
                 type="text",
-                text=create_success_response(
-                    f"Comprehensive analysis completed in {duration:.2f}s with {len([k for k, v in response_data['features_analyzed'].items() if v])} features",
-                    response_data
-                ).content[0].text
+                text=response.content[0].text
             )]
             
         except Exception as e:
@@ -478,16 +785,11 @@ class ConsolidatedDocumentationTools:
             logger.info(f"Generating comprehensive documentation for analysis {analysis_id}")
             
             # Check if analysis exists in cache
-            if analysis_id not in self.analysis_cache:
-                return [TextContent(
-                    type="text",
-                    text=create_error_response(
-                        f"Analysis ID {analysis_id} not found. Please run analyze_codebase first."
-                    ).content[0].text
-                )]
+            comprehensive_data = self.analysis_cache.get(analysis_id)
+            if comprehensive_data is None:
+                return [_analysis_not_found_content(analysis_id)]
             
-            comprehensive_data = self.analysis_cache[analysis_id]
-            os.makedirs(output_directory, exist_ok=True)
+            await asyncio.to_thread(os.makedirs, output_directory, exist_ok=True)
             
             # Auto-detect title if not provided
             if not title:
@@ -498,20 +800,29 @@ class ConsolidatedDocumentationTools:
             # 1. Generate main professional documentation
             main_doc_path = os.path.join(output_directory, f"{analysis_id}_{format}_documentation.md")
             
-            main_documentation = self.doc_generator.generate_documentation(
-                analysis_result=comprehensive_data,
-                project_root="",
-                output_path=main_doc_path,
-                repo_url=comprehensive_data.get('path', '')
-            )
-            
-            generated_files = [{
-                'type': 'markdown',
-                'format': format,
-                'path': main_doc_path,
-                'size': len(main_documentation) if main_documentation else 0,
-                'status': 'success'
-            }]
+            # The markdown depends only on the cached analysis, so a render from an
+            # earlier call for the same analysis_id can be written out as is
+            main_documentation = self.rendered_docs.get(analysis_id)
+            if main_documentation is not None:
+                await asyncio.to_thread(self.doc_generator._save_document, main_doc_path, main_documentation)
+            else:
+                # Rendering and the file write block, so they run off the event loop
+                main_documentation = await self._run_generator(
+                    'generate_documentation',
+                    analysis_result=comprehensive_data,
+                    project_root="",
+                    output_path=main_doc_path,
+                    repo_url=comprehensive_data.get('path', '')
+                )
+                self.rendered_docs[analysis_id] = main_documentation
+            
+            generated_files = [GeneratedFile(
+                type='markdown',
+                format=format,
+                path=main_doc_path,
+                size=len(main_documentation) if main_documentation else 0,
+                status='success'
+            )]
             
             # 2. Generate interactive version (if requested)
             interactive_path = None
@@ -519,7 +830,8 @@ class ConsolidatedDocumentationTools:
                 logger.info("Creating interactive HTML documentation...")
                 try:
                     interactive_path = os.path.join(output_directory, f"{analysis_id}_interactive.html")
-                    interactive_content = self.doc_generator.generate_interactive_documentation(
+                    interactive_content = await self._run_generator(
+                        'generate_interactive_documentation',
                         analysis_result=comprehensive_data,
                         title=title,
                         theme=theme,
@@ -528,21 +840,21 @@ class ConsolidatedDocumentationTools:
                         include_live_diagrams=include_live_diagrams,
                         output_path=interactive_path
                     )
-                    generated_files.append({
-                        'type': 'interactive_html',
-                        'format': 'interactive',
-                        'path': interactive_path,
-                        'size': len(interactive_content) if isinstance(interactive_content, str) else 'N/A',
-                        'status': 'success'
-                    })
+                    generated_files.append(GeneratedFile(
+                        type='interactive_html',
+                        format='interactive',
+                        path=interactive_path,
+                        size=len(interactive_content) if isinstance(interactive_content, str) else 'N/A',
+                        status='success'
+                    ))
                 except Exception as e:
                     logger.error(f"Interactive documentation generation failed: {e}")
-                    generated_files.append({
-                        'type': 'interactive_html',
-                        'format': 'interactive',
-                        'status': 'failed',
-                        'error': str(e)
-                    })
+                    generated_files.append(GeneratedFile(
+                        type='interactive_html',
+                        format='interactive',
+                        status='failed',
+                        error=str(e)
+                    ))
             
             # 3. Auto-export to multiple formats (if requested)
             if auto_export_formats is None:
@@ -553,33 +865,40 @@ class ConsolidatedDocumentationTools:
             exported_files = []
             if auto_export_formats:
                 logger.info(f"Auto-exporting to {len(auto_export_formats)} additional formats...")
-                for export_format in auto_export_formats:
-                    try:
-                        export_path = os.path.join(output_directory, f"{analysis_id}_{export_format}_export.{export_format}")
-                        exported_content = self.doc_generator.export_documentation(
-                            analysis_result=comprehensive_data,
+                export_paths = [
+                    os.path.join(output_directory, f"{analysis_id}_{export_format}_export.{export_format}")
+                    for export_format in auto_export_formats
+                ]
+                # Each export renders and writes a file; run them side by side off the event loop
+                results = await asyncio.gather(
+                    *(self._export_in_thread(
+                        analysis_result=comprehensive_data,
+                        format=export_format,
+                        theme=theme,
+                        title=title,
+                        include_toc=include_navigation,
+                        include_diagrams=include_mermaid_diagrams,
+                        include_search=include_search and export_format == 'html',
+                        custom_css=custom_css,
+                        output_path=export_path
+                    ) for export_format, export_path in zip(auto_export_formats, export_paths)),
+                    return_exceptions=True
+                )
+                for export_format, export_path, exported_content in zip(auto_export_formats, export_paths, results):
+                    if isinstance(exported_content, Exception):
+                        logger.warning(f"Export to {export_format} failed: {exported_content}")
+                        exported_files.append(ExportedFile(
                             format=export_format,
-                            theme=theme,
-                            title=title,
-                            include_toc=include_navigation,
-                            include_diagrams=include_mermaid_diagrams,
-                            include_search=include_search and export_format == 'html',
-                            custom_css=custom_css,
-                            output_path=export_path
-                        )
-                        exported_files.append({
-                            'format': export_format,
-                            'path': export_path,
-                            'size': len(exported_content) if isinstance(exported_content, str) else 'N/A',
-                            'status': 'success'
-                        })
-                    except Exception as e:
-                        logger.warning(f"Export to {export_format} failed: {e}")
-                        exported_files.append({
-                            'format': export_format,
-                            'status': 'failed',
-                            'error': str(e)
-                        })
+                            status='failed',
+                            error=str(exported_content)
+                        ))
+                    else:
+                        exported_files.append(ExportedFile(
+                            format=export_format,
+                            path=export_path,
+                            size=len(exported_content) if isinstance(exported_content, str) else 'N/A',
+                            status='success'
+                        ))
             
             # 4. Generate documentation statistics and summary
             doc_stats = self._calculate_documentation_stats(
@@ -596,9 +915,9 @@ class ConsolidatedDocumentationTools:
                 'language': language,
                 
                 # Documentation files created
-                'generated_files': generated_files,
-                'exported_files': exported_files,
-                'total_files_created': len(generated_files) + len([f for f in exported_files if f.get('status') == 'success']),
+                'generated_files': [f.to_dict() for f in generated_files],
+                'exported_files': [f.to_dict() for f in exported_files],
+                'total_files_created': len(generated_files) + len([f for f in exported_files if f.status == 'success']),
                 
                 # Content statistics
                 'documentation_stats': doc_stats,
@@ -626,9 +945,9 @@ class ConsolidatedDocumentationTools:
                 # Export summary
                 'export_summary': {
                     'formats_generated': len(generated_files),
-                    'formats_exported': len([f for f in exported_files if f.get('status') == 'success']),
-                    'total_formats': len(generated_files) + len([f for f in exported_files if f.get('status') == 'success']),
-                    'failed_exports': [f for f in exported_files if f.get('status') == 'failed']
+                    'formats_exported': len([f for f in exported_files if f.status == 'success']),
+                    'total_formats': len(generated_files) + len([f for f in exported_files if f.status == 'success']),
+                    'failed_exports': [f.to_dict() for f in exported_files if f.status == 'failed']
                 },
                 
                 # Preview of main documentation
@@ -749,7 +1068,8 @@ class ConsolidatedDocumentationTools:
             include_analytics: Include analytics tracking (for web formats)
             optimize_images: Optimize embedded images for size
             minify_html: Minify HTML and CSS output
-            compress_output: Compress output files (ZIP)
+            compress_output: Gzip text-format output files (written as <file>.gz);
+                HTML is left uncompressed when generate_sitemap is set
             validate_output: Validate all exported files
             generate_sitemap: Generate XML sitemap for HTML exports
             custom_css: Custom CSS for styling
@@ -775,47 +1095,42 @@ class ConsolidatedDocumentationTools:
             logger.info(f"Exporting documentation to {len(formats)} formats for analysis {analysis_id}")
             
             # Check if analysis exists
-            if analysis_id not in self.analysis_cache:
-                return [TextContent(
-                    type="text",
-                    text=create_error_response(
-                        f"Analysis ID {analysis_id} not found. Please run analyze_codebase first."
-                    ).content[0].text
-                )]
+            comprehensive_data = self.analysis_cache.get(analysis_id)
+            if comprehensive_data is None:
+                return [_analysis_not_found_content(analysis_id)]
             
-            comprehensive_data = self.analysis_cache[analysis_id]
             
             # Create output directory structure
             os.makedirs(output_directory, exist_ok=True)
+            abs_output_directory = os.path.abspath(output_directory)
+            # Per-language directories are resolved once and reused for every format
+            language_dirs = {}
             if languages and len(languages) > 1:
                 for lang in languages:
-                    os.makedirs(os.path.join(output_directory, lang), exist_ok=True)
+                    language_dirs[lang] = os.path.join(output_directory, lang)
+                    os.makedirs(language_dirs[lang], exist_ok=True)
             
             # Auto-detect title if not provided
             if not title:
                 title = self._extract_project_title(comprehensive_data)
             
-            export_results = []
-            total_size = 0
-            successful_exports = 0
-            failed_exports = 0
+            file_stem = title.replace(' ', '_').lower()
             
-            # Export to all requested formats
-            for format_type in formats:
+            async def export_format(format_type: str) -> Dict[str, Any]:
                 logger.info(f"Exporting to {format_type.upper()} format...")
+                file_name = f"{file_stem}.{format_type}"
                 
                 try:
                     # Handle multi-language exports
                     if languages and len(languages) > 1:
-                        language_results = []
-                        for lang in languages:
-                            lang_output_path = os.path.join(output_directory, lang, f"{title.replace(' ', '_').lower()}.{format_type}")
-                            lang_result = await self._export_single_format(
-                                comprehensive_data, format_type, lang_output_path,
+                        language_results = await asyncio.gather(*(
+                            self._export_single_format(
+                                comprehensive_data, format_type,
+                                os.path.join(language_dirs[lang], file_name),
                                 theme, title, lang, custom_css, custom_header, custom_footer,
                                 include_toc, include_diagrams, include_search
-                            )
-                            language_results.append(lang_result)
+                            ) for lang in languages
+                        ))
                         
                         # Combine language results
                         export_result = {
@@ -827,7 +1142,7 @@ class ConsolidatedDocumentationTools:
                         }
                     else:
                         # Single language export
-                        output_path = os.path.join(output_directory, f"{title.replace(' ', '_').lower()}.{format_type}")
+                        output_path = os.path.join(output_directory, file_name)
                         export_result = await self._export_single_format(
                             comprehensive_data, format_type, output_path,
                             theme, title, default_language, custom_css, custom_header, custom_footer,
@@ -836,7 +1151,9 @@ class ConsolidatedDocumentationTools:
                     
                     # Validate export if requested
                     if validate_output and export_result.get('status') == 'success':
-                        validation_result = self._validate_exported_file(export_result, format_type)
+                        validation_result = await asyncio.to_thread(
+                            self._validate_exported_file, export_result, format_type
+                        )
                         export_result['validation'] = validation_result
                     
                     # Add optimization results
@@ -844,23 +1161,65 @@ class ConsolidatedDocumentationTools:
                         optimization_result = self._optimize_export(export_result)
                         export_result['optimization'] = optimization_result
                     
-                    export_results.append(export_result)
+                    # Compress text outputs once they have been validated. HTML listed in a
+                    # sitemap stays uncompressed so its URLs open as pages in a browser
+                    if (
+                        compress_output
+                        and format_type in COMPRESSIBLE_FORMATS
+                        and not (generate_sitemap and format_type == 'html')
+                    ):
+                        if export_result.get('multi_language'):
+                            for lang_result in export_result['languages']:
+                                await asyncio.to_thread(self._compress_export_file, lang_result)
+                            export_result['total_size'] = sum(r.get('size_bytes', 0) for r in export_result['languages'])
+                        else:
+                            await asyncio.to_thread(self._compress_export_file, export_result)
                     
-                    if export_result.get('status') == 'success':
-                        successful_exports += 1
-                        total_size += export_result.get('size_bytes', 0)
-                    else:
-                        failed_exports += 1
+                    return export_result
                         
                 except Exception as e:
                     logger.error(f"Failed to export to {format_type}: {e}")
-                    export_results.append({
+                    return {
                         'format': format_type,
                         'status': 'failed',
                         'error': str(e),
                         'size_bytes': 0
-                    })
+                    }
+            
+            # Formats are independent, so export them side by side; renders are
+            # bounded by the EXPORT_CONCURRENCY semaphore in _export_in_thread
+            export_results = list(await asyncio.gather(*(export_format(f) for f in formats)))
+            
+            # Tally everything the response reports in one sweep over the results
+            total_size = 0
+            successful_exports = 0
+            failed_exports = 0
+            validation_passed = 0
+            accessibility_compliant = 0
+            optimization_applied = 0
+            formats_successful = []
+            formats_failed = []
+            largest_file = None
+            largest_size = 0
+            for export_result in export_results:
+                status = export_result.get('status')
+                if status == 'success':
+                    successful_exports += 1
+                    total_size += export_result.get('size_bytes', 0)
+                    formats_successful.append(export_result['format'])
+                else:
                     failed_exports += 1
+                    if status == 'failed':
+                        formats_failed.append(export_result['format'])
+                if export_result.get('validation', {}).get('valid', False):
+                    validation_passed += 1
+                if export_result.get('accessibility', {}).get('compliant', False):
+                    accessibility_compliant += 1
+                if export_result.get('optimization', {}).get('applied', False):
+                    optimization_applied += 1
+                size = export_result.get('size_bytes', 0)
+                if largest_file is None or size > largest_size:
+                    largest_file, largest_size = export_result, size
             
             # Generate comprehensive archive if requested
             archive_info = None
@@ -902,7 +1261,7 @@ class ConsolidatedDocumentationTools:
                 # File information
                 'total_size_bytes': total_size,
                 'total_size_human': self._format_file_size(total_size),
-                'largest_file': max(export_results, key=lambda x: x.get('size_bytes', 0)) if export_results else None,
+                'largest_file': largest_file,
                 
                 # Export statistics
                 'export_statistics': export_stats,
@@ -913,16 +1272,16 @@ class ConsolidatedDocumentationTools:
                 
                 # Quality metrics
                 'quality_metrics': {
-                    'validation_passed': sum(1 for r in export_results if r.get('validation', {}).get('valid', False)),
-                    'accessibility_compliant': sum(1 for r in export_results if r.get('accessibility', {}).get('compliant', False)),
-                    'optimization_applied': sum(1 for r in export_results if r.get('optimization', {}).get('applied', False))
+                    'validation_passed': validation_passed,
+                    'accessibility_compliant': accessibility_compliant,
+                    'optimization_applied': optimization_applied
                 },
                 
                 # Format breakdown
                 'format_summary': {
                     'formats_requested': formats,
-                    'formats_successful': [r['format'] for r in export_results if r.get('status') == 'success'],
-                    'formats_failed': [r['format'] for r in export_results if r.get('status') == 'failed'],
+                    'formats_successful': formats_successful,
+                    'formats_failed': formats_failed,
                     'success_rate': f"{successful_exports}/{len(formats)} ({(successful_exports/len(formats)*100):.1f}%)"
                 },
                 
@@ -935,9 +1294,9 @@ class ConsolidatedDocumentationTools:
                 
                 # Quick access
                 'quick_access': {
-                    'browse_exports': f"file://{os.path.abspath(output_directory)}",
+                    'browse_exports': f"file://{abs_output_directory}",
                     'archive_download': archive_info.get('path') if archive_info and archive_info.get('status') == 'success' else None,
-                    'largest_export': max(export_results, key=lambda x: x.get('size_bytes', 0)).get('path') if export_results else None
+                    'largest_export': largest_file.get('path') if largest_file else None
                 }
             }
             
@@ -961,10 +1320,8 @@ class ConsolidatedDocumentationTools:
     # Helper methods for comprehensive functionality
     
     def _generate_analysis_id(self, path: str) -> str:
-        """Generate unique analysis ID."""
-        import hashlib
-        import time
-        return hashlib.md5(f"{path}:{time.time()}".encode()).hexdigest()[:16]
+        """Generate unique analysis ID: a per-instance sequence number plus random suffix, 16 hex chars."""
+        return f"{next(self._id_counter):08x}{secrets.token_hex(4)}"
     
     def _create_tech_stack_summary(self, frameworks: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Create comprehensive technology stack summary."""
@@ -1022,6 +1379,14 @@ class ConsolidatedDocumentationTools:
     
     def _calculate_comprehensive_metrics(self, ast_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate comprehensive code metrics."""
+        return self._calculate_code_metrics(ast_data)[0]
+    
+    def _analyze_code_complexity(self, ast_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Analyze code complexity in detail."""
+        return self._calculate_code_metrics(ast_data)[1]
+    
+    def _calculate_code_metrics(self, ast_data: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Calculate code metrics and the complexity breakdown in one pass over the AST data."""
         metrics = {
             'total_files_analyzed': len(ast_data),
             'total_classes': 0,
@@ -1033,8 +1398,18 @@ class ConsolidatedDocumentationTools:
             'max_complexity': 0,
             'code_quality_score': 0
         }
+        complexity_analysis = {
+            'overall_complexity': 'low',
+            'high_complexity_files': [],
+            'complexity_distribution': dict.fromkeys(COMPLEXITY_BANDS, 0),
+            'recommendations': []
+        }
+        distribution = complexity_analysis['complexity_distribution']
         
-        complexity_scores = []
+        # The per-file dict reads stay in one Python pass; the complexity
+        # reductions then run over the collected score column
+        scores = []
+        file_paths = []
         for file_data in ast_data:
             if isinstance(file_data, dict):
                 metrics['total_classes'] += len(file_data.get('classes', []))
@@ -1042,52 +1417,47 @@ class ConsolidatedDocumentationTools:
                 metrics['total_imports'] += len(file_data.get('imports', []))
                 metrics['total_lines'] += file_data.get('lines', 0)
                 metrics['languages'].add(file_data.get('language', 'unknown'))
-                
-                complexity = file_data.get('complexity_score', 0)
-                if complexity > 0:
-                    complexity_scores.append(complexity)
+                scores.append(file_data.get('complexity_score', 0))
+                file_paths.append(file_data.get('file_path', 'unknown'))
         
-        if complexity_scores:
-            metrics['average_complexity'] = sum(complexity_scores) / len(complexity_scores)
-            metrics['max_complexity'] = max(complexity_scores)
+        try:
+            # Imported here so NumPy's import cost is only paid when metrics are computed
+            import numpy as np
+        except ImportError:
+            np = None
         
-        metrics['languages'] = list(metrics['languages'])
-        return metrics
-    
-    def _analyze_code_complexity(self, ast_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze code complexity in detail."""
-        complexity_analysis = {
-            'overall_complexity': 'low',
-            'high_complexity_files': [],
-            'complexity_distribution': {
-                'low': 0, 'medium': 0, 'high': 0, 'very_high': 0
-            },
-            'recommendations': []
-        }
+        if np is not None and scores:
+            column = np.asarray(scores)
+            positive = column[column > 0]
+            if positive.size:
+                metrics['average_complexity'] = float(positive.mean())
+                metrics['max_complexity'] = positive.max().item()
+            band_counts = np.bincount(
+                np.searchsorted(COMPLEXITY_BAND_EDGES, column, side='left'),
+                minlength=len(COMPLEXITY_BANDS)
+            )
+            for band, count in zip(COMPLEXITY_BANDS, band_counts.tolist()):
+                distribution[band] = count
+            very_high = np.flatnonzero(column > COMPLEXITY_BAND_EDGES[-1]).tolist()
+        else:
+            positive = [score for score in scores if score > 0]
+            if positive:
+                metrics['average_complexity'] = sum(positive) / len(positive)
+                metrics['max_complexity'] = max(positive)
+            for score in scores:
+                distribution[COMPLEXITY_BANDS[bisect.bisect_left(COMPLEXITY_BAND_EDGES, score)]] += 1
+            very_high = [index for index, score in enumerate(scores) if score > COMPLEXITY_BAND_EDGES[-1]]
         
-        for file_data in ast_data:
-            if isinstance(file_data, dict):
-                complexity = file_data.get('complexity_score', 0)
-                file_path = file_data.get('file_path', 'unknown')
-                
-                if complexity > 50:
-                    complexity_analysis['complexity_distribution']['very_high'] += 1
-                    complexity_analysis['high_complexity_files'].append({
-                        'file': file_path,
-                        'complexity': complexity
-                    })
-                elif complexity > 25:
-                    complexity_analysis['complexity_distribution']['high'] += 1
-                elif complexity > 10:
-                    complexity_analysis['complexity_distribution']['medium'] += 1
-                else:
-                    complexity_analysis['complexity_distribution']['low'] += 1
+        complexity_analysis['high_complexity_files'] = [
+            {'file': file_paths[index], 'complexity': scores[index]} for index in very_high
+        ]
+        
+        metrics['languages'] = list(metrics['languages'])
         
         # Determine overall complexity
-        total_files = sum(complexity_analysis['complexity_distribution'].values())
+        total_files = sum(distribution.values())
         if total_files > 0:
-            high_ratio = (complexity_analysis['complexity_distribution']['high'] + 
-                         complexity_analysis['complexity_distribution']['very_high']) / total_files
+            high_ratio = (distribution['high'] + distribution['very_high']) / total_files
             
             if high_ratio > 0.3:
                 complexity_analysis['overall_complexity'] = 'very_high'
@@ -1096,7 +1466,28 @@ class ConsolidatedDocumentationTools:
             elif high_ratio > 0.05:
                 complexity_analysis['overall_complexity'] = 'medium'
         
-        return complexity_analysis
+        return metrics, complexity_analysis
+    
+    async def _export_in_thread(self, **export_kwargs) -> Any:
+        """Run one doc_generator export off the event loop, at most EXPORT_CONCURRENCY at a time."""
+        async with self._export_semaphore:
+            return await self._run_generator('export_documentation', **export_kwargs)
+    
+    async def _run_generator(self, method: str, **kwargs) -> Any:
+        """Call a doc_generator method off the event loop: on the process pool if enabled, else a thread."""
+        if not self.use_processes:
+            return await asyncio.to_thread(getattr(self.doc_generator, method), **kwargs)
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._process_pool, functools.partial(_run_generator_in_worker, method, kwargs)
+        )
+    
+    async def _generate_diagram_bounded(self, diagram_type: str, comprehensive_data: Dict[str, Any], path: str) -> str:
+        """_generate_diagram, limited to DIAGRAM_CONCURRENCY concurrent builds."""
+        async with self._diagram_semaphore:
+            return await self._generate_diagram(diagram_type, comprehensive_data, path)
     
     async def _generate_diagram(self, diagram_type: str, comprehensive_data: Dict[str, Any], path: str) -> str:
         """Generate specific mermaid diagram type."""
@@ -1104,7 +1495,7 @@ class ConsolidatedDocumentationTools:
             if diagram_type == 'architecture':
                 components = self._extract_architecture_components(comprehensive_data)
                 relationships = self._extract_architecture_relationships(comprehensive_data)
-                repo_name = path.split('/')[-1] if '/' in path else "Repository"
+                repo_name = _project_name(path, "Repository")
                 return self.mermaid_generator.generate_architecture_diagram(
                     components, relationships, f"{repo_name} Architecture"
                 )
@@ -1112,7 +1503,7 @@ class ConsolidatedDocumentationTools:
             elif diagram_type == 'dependencies':
                 deps = comprehensive_data.get('dependencies', [])
                 if deps:
-                    repo_name = path.split('/')[-1] if '/' in path else "Repository"
+                    repo_name = _project_name(path, "Repository")
                     dep_dict = {repo_name: deps[:15]}  # Limit for readability
                     return self.mermaid_generator.generate_dependency_graph(
                         dep_dict, f"{repo_name} Dependencies"
@@ -1203,24 +1594,25 @@ class ConsolidatedDocumentationTools:
         # Try to get from path
         path = comprehensive_data.get('path', '')
         if path:
-            title = path.split('/')[-1] if '/' in path else path
-            return title.replace('-', ' ').replace('_', ' ').title()
+            return _project_title(path)
         
         return "Project Documentation"
     
     def _calculate_documentation_stats(self, main_doc: str, comprehensive_data: Dict[str, Any], 
-                                     generated_files: List[Dict], exported_files: List[Dict]) -> Dict[str, Any]:
+                                     generated_files: List[GeneratedFile], exported_files: List[ExportedFile]) -> Dict[str, Any]:
         """Calculate comprehensive documentation statistics."""
+        # Split once; the word count feeds both the count and the reading time
+        word_count = len(main_doc.split()) if main_doc else 0
         stats = {
-            'word_count': len(main_doc.split()) if main_doc else 0,
+            'word_count': word_count,
             'character_count': len(main_doc) if main_doc else 0,
             'section_count': main_doc.count('##') if main_doc else 0,
             'code_block_count': main_doc.count('```') // 2 if main_doc else 0,
             'diagram_count': len(comprehensive_data.get('mermaid_diagrams', {})),
             'files_generated': len(generated_files),
-            'files_exported': len([f for f in exported_files if f.get('status') == 'success']),
-            'total_file_size': sum(f.get('size', 0) for f in generated_files + exported_files),
-            'estimated_reading_time': (len(main_doc.split()) // 200) if main_doc else 0  # ~200 WPM
+            'files_exported': len([f for f in exported_files if f.status == 'success']),
+            'total_file_size': sum(f.size for f in generated_files + exported_files if isinstance(f.size, int)),
+            'estimated_reading_time': word_count // 200  # ~200 WPM
         }
         
         return stats
@@ -1231,7 +1623,7 @@ class ConsolidatedDocumentationTools:
                                    include_toc: bool, include_diagrams: bool, include_search: bool) -> Dict[str, Any]:
         """Export to a single format with all options."""
         try:
-            exported_content = self.doc_generator.export_documentation(
+            exported_content = await self._export_in_thread(
                 analysis_result=data,
                 format=format_type,
                 theme=theme,
@@ -1243,9 +1635,10 @@ class ConsolidatedDocumentationTools:
                 output_path=output_path
             )
             
-            file_size = 0
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path)
+            try:
+                file_size = os.stat(output_path).st_size
+            except OSError:
+                file_size = 0
             
             return {
                 'format': format_type,
@@ -1277,9 +1670,13 @@ class ConsolidatedDocumentationTools:
         }
         
         file_path = export_result.get('path')
-        if file_path and os.path.exists(file_path):
+        try:
+            file_size = os.stat(file_path).st_size if file_path else None
+        except OSError:
+            file_size = None
+        if file_size is not None:
             validation['file_exists'] = True
-            validation['file_size'] = os.path.getsize(file_path)
+            validation['file_size'] = file_size
             
             if validation['file_size'] > 0:
                 validation['valid'] = True
@@ -1302,16 +1699,22 @@ class ConsolidatedDocumentationTools:
         validation = {'valid': True, 'issues': []}
         
         try:
+            # Scan chunk by chunk, carrying a short tail so markers split across
+            # chunk boundaries still match, and stop once every marker is seen
+            missing = dict(HTML_REQUIRED_MARKERS)
+            overlap = max(len(marker) for marker in missing) - 1
+            tail = ''
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            if '<!DOCTYPE html>' not in content:
-                validation['issues'].append('Missing DOCTYPE declaration')
-            if '<html' not in content:
-                validation['issues'].append('Missing HTML tag')
-            if '<title>' not in content:
-                validation['issues'].append('Missing title tag')
-                
+                while missing:
+                    chunk = f.read(EXPORT_SCAN_CHUNK)
+                    if not chunk:
+                        break
+                    window = tail + chunk
+                    for marker in [marker for marker in missing if marker in window]:
+                        del missing[marker]
+                    tail = window[-overlap:]
+            
+            validation['issues'].extend(missing.values())
             validation['valid'] = len(validation['issues']) == 0
         except Exception as e:
             validation['valid'] = False
@@ -1351,13 +1754,37 @@ class ConsolidatedDocumentationTools:
         
         return optimization
     
+    def _compress_export_file(self, export_result: Dict[str, Any]) -> None:
+        """Replace a successful export with a gzip copy at ``<path>.gz``, updating the result in place."""
+        file_path = export_result.get('path')
+        if export_result.get('status') != 'success' or not file_path:
+            return
+        try:
+            compressed_path = f"{file_path}.gz"
+            with open(file_path, 'rb') as src, gzip.open(compressed_path, 'wb', compresslevel=EXPORT_COMPRESS_LEVEL) as dst:
+                shutil.copyfileobj(src, dst, EXPORT_SCAN_CHUNK)
+            os.remove(file_path)
+            
+            compressed_size = os.stat(compressed_path).st_size
+            export_result['compression'] = {
+                'method': 'gzip',
+                'original_size_bytes': export_result.get('size_bytes', 0),
+                'compressed_size_bytes': compressed_size
+            }
+            export_result['path'] = compressed_path
+            export_result['size_bytes'] = compressed_size
+            export_result['size_human'] = self._format_file_size(compressed_size)
+        except Exception as e:
+            logger.warning(f"Failed to compress {file_path}: {e}")
+            export_result['compression'] = {'method': 'gzip', 'error': str(e)}
+    
     def _create_export_archive(self, export_results: List[Dict], output_dir: str, title: str) -> Dict[str, Any]:
         """Create comprehensive archive of all exports."""
         try:
             import zipfile
             archive_path = os.path.join(output_dir, f"{title.replace(' ', '_').lower()}_complete_export.zip")
             
-            with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=EXPORT_COMPRESS_LEVEL) as zipf:
                 for result in export_results:
                     if result.get('status') == 'success' and os.path.exists(result.get('path', '')):
                         file_path = result['path']
@@ -1388,15 +1815,18 @@ class ConsolidatedDocumentationTools:
             sitemap_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
             sitemap_content += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
             
+            # Resolved once for all entries rather than per file
+            cwd = os.getcwd()
+            lastmod = datetime.now().strftime("%Y-%m-%d")
             for result in export_results:
                 if result.get('format') == 'html' and result.get('status') == 'success':
                     file_path = result.get('path', '')
                     if file_path:
-                        # Convert file path to URL (simplified)
-                        url = f"file://{os.path.abspath(file_path)}"
+                        # Convert file path to URL (simplified); same result as os.path.abspath
+                        url = f"file://{os.path.normpath(os.path.join(cwd, file_path))}"
                         sitemap_content += f'  <url>\n'
                         sitemap_content += f'    <loc>{url}</loc>\n'
-                        sitemap_content += f'    <lastmod>{datetime.now().strftime("%Y-%m-%d")}</lastmod>\n'
+                        sitemap_content += f'    <lastmod>{lastmod}</lastmod>\n'
                         sitemap_content += f'  </url>\n'
             
             sitemap_content += '</urlset>\n'
@@ -1576,11 +2006,52 @@ class ConsolidatedDocumentationTools:
             logger.warning(f"Error converting structure to dict: {e}")
             return {'error': 'structure_conversion_failed'}
     
+    # Background analysis methods
+    
+    async def get_background_status(self, task_id: str) -> List[TextContent]:
+        """
+        Report on a background analysis started with background_processing=True.
+        
+        While the analysis runs this returns its status; once finished it returns
+        the analysis response itself and forgets the task. Uncollected results are
+        dropped after ANALYSIS_CACHE_TTL.
+        """
+        if task_id in self._background_tasks:
+            return [TextContent(
+                type="text",
+                text=create_success_response(
+                    f"Background analysis {task_id} is still running",
+                    {'task_id': task_id, 'status': 'running'}
+                ).content[0].text
+            )]
+        result = self._background_results.get(task_id)
+        if result is None:
+            return [TextContent(
+                type="text",
+                text=create_error_response(f"Background task {task_id} not found").content[0].text
+            )]
+        del self._background_results[task_id]
+        return result
+    
+    def _finish_background_task(self, task_id: str, task: asyncio.Task) -> None:
+        """Done callback: keep only the finished response, so the task itself can be released."""
+        self._background_tasks.pop(task_id, None)
+        if task.cancelled() or task.exception() is not None:
+            error = 'cancelled' if task.cancelled() else str(task.exception())
+            result = [TextContent(
+                type="text",
+                text=create_error_response(f"Background analysis {task_id} failed: {error}").content[0].text
+            )]
+        else:
+            result = task.result()
+        self._background_results[task_id] = result
+    
     # Cache management methods
     
     def clear_analysis_cache(self):
         """Clear the analysis cache."""
         self.analysis_cache.clear()
+        self.rendered_docs.clear()
         logger.info("Analysis cache cleared")
     
     def get_cache_info(self) -> Dict[str, Any]:
@@ -1597,6 +2068,8 @@ class ConsolidatedDocumentationTools:
         """Remove specific analysis from cache."""
         if analysis_id in self.analysis_cache:
             del self.analysis_cache[analysis_id]
+            if analysis_id in self.rendered_docs:
+                del self.rendered_docs[analysis_id]
             logger.info(f"Removed analysis {analysis_id} from cache")
             return True
         return False
\ No newline at end of file